@@ -1,16 +1,17 @@
 """CLI review interface for reviewing and editing extracted form data."""
 
+import sys
 from typing import Optional
 
 
 def _safe_print(text: str) -> None:
     """Print text, replacing characters that can't be encoded in the console."""
     try:
-        print(text)
+        sys.stdout.write(text + '\n')
     except UnicodeEncodeError:
         # Replace problematic characters with ASCII equivalents
         safe_text = text.encode('ascii', errors='replace').decode('ascii')
-        print(safe_text)
+        sys.stdout.write(safe_text + '\n')
 
 
 def print_table(data: dict[str, str], title: str = "Extracted Data") -> None:
@@ -21,59 +22,72 @@ def print_table(data: dict[str, str], title: str = "Extracted Data") -> None:
         data: Dictionary of field names to values
         title: Title to display above the table
     """
-    # Filter out internal fields (starting with _)
-    display_data = {k: v for k, v in data.items() if not k.startswith('_')}
+    # Filter out internal fields (starting with _), stringify values and
+    # measure column widths in a single pass
+    rows = []
+    max_field = 0
+    max_value = 0
+    for field, value in data.items():
+        if field.startswith('_'):
+            continue
+        display_value = str(value) if value else "(empty)"
+        max_field = max(max_field, len(field))
+        max_value = max(max_value, len(display_value))
+        rows.append((field, display_value))
 
-    if not display_data:
+    if not rows:
         print("No data to display.")
         return
 
     # Calculate column widths
-    field_width = max(len(str(k)) for k in display_data.keys()) + 2
-    value_width = max(len(str(v)) for v in display_data.values()) + 2
-    value_width = min(max(value_width, 20), 50)  # Min 20, max 50
-
-    # Print title
-    print(f"\n=== {title} ===")
-
-    # Print top border
-    print(f"+-{'-' * field_width}-+-{'-' * value_width}-+")
+    field_width = max_field + 2
+    value_width = min(max(max_value + 2, 20), 50)  # Min 20, max 50
 
-    # Print header
-    print(f"| {'Field':<{field_width}} | {'Value':<{value_width}} |")
+    border = f"+-{'-' * field_width}-+-{'-' * value_width}-+"
 
-    # Print separator
-    print(f"+-{'-' * field_width}-+-{'-' * value_width}-+")
+    # Title, top border, header and separator
+    lines = [
+        f"\n=== {title} ===",
+        border,
+        f"| {'Field':<{field_width}} | {'Value':<{value_width}} |",
+        border,
+    ]
 
-    # Print data rows
-    for field, value in display_data.items():
-        display_value = str(value) if value else "(empty)"
+    # Data rows
+    for field, display_value in rows:
         # Truncate long values
         if len(display_value) > value_width:
             display_value = display_value[:value_width - 3] + "..."
-        _safe_print(f"| {field:<{field_width}} | {display_value:<{value_width}} |")
+        lines.append(f"| {field:<{field_width}} | {display_value:<{value_width}} |")
+
+    # Bottom border
+    lines.append(border)
 
-    # Print bottom border
-    print(f"+-{'-' * field_width}-+-{'-' * value_width}-+")
+    # Write the whole table at once
+    _safe_print('\n'.join(lines))
 
 
-def edit_field(data: dict[str, str], field_name: str) -> dict[str, str]:
+def edit_field(
+    data: dict[str, str],
+    field_name: str,
+    lower_index: Optional[dict[str, str]] = None
+) -> dict[str, str]:
     """
     Edit a specific field value.
 
     Args:
         data: Dictionary of field data
         field_name: Name of field to edit
+        lower_index: Optional mapping of lowercased field name to field name
+                     (built from data if not provided)
 
     Returns:
         Updated data dictionary
     """
     # Find matching field (case-insensitive)
-    matching_field = None
-    for key in data.keys():
-        if key.lower() == field_name.lower():
-            matching_field = key
-            break
+    if lower_index is None:
+        lower_index = {key.lower(): key for key in data}
+    matching_field = lower_index.get(field_name.lower())
 
     if not matching_field:
         print(f"Field '{field_name}' not found. Available fields:")
@@ -95,6 +109,42 @@ def edit_field(data: dict[str, str], field_name: str) -> dict[str, str]:
     return data
 
 
+def _enable_field_completion(field_names: list[str]):
+    """
+    Enable tab completion of field names for input().
+
+    Args:
+        field_names: Field names to complete
+
+    Returns:
+        Function that restores the previous completer, or None if readline
+        isn't available (e.g., Windows without pyreadline3)
+    """
+    try:
+        import readline
+    except ImportError:
+        return None
+
+    previous_completer = readline.get_completer()
+    previous_delims = readline.get_completer_delims()
+
+    def complete(text: str, state: int) -> Optional[str]:
+        prefix = text.lower()
+        matches = [name for name in field_names if name.lower().startswith(prefix)]
+        return matches[state] if state < len(matches) else None
+
+    readline.set_completer(complete)
+    # Field names contain spaces and '/', so complete the whole line
+    readline.set_completer_delims('')
+    readline.parse_and_bind('tab: complete')
+
+    def restore() -> None:
+        readline.set_completer(previous_completer)
+        readline.set_completer_delims(previous_delims)
+
+    return restore
+
+
 def review_and_edit(data: dict[str, str]) -> dict[str, str]:
     """
     Interactive review and edit loop.
@@ -105,31 +155,46 @@ def review_and_edit(data: dict[str, str]) -> dict[str, str]:
     Returns:
         Updated data dictionary after user review
     """
-    while True:
-        print_table(data)
-        print("\nOptions:")
-        print("  - Enter a field name to edit it")
-        print("  - Type 'ok' or press Enter to continue")
-        print("  - Type 'raw' to see raw OCR text (if available)")
-        print("  - Type 'quit' to cancel")
-
-        choice = input("\nEdit a field? ").strip().lower()
-
-        if choice in ('ok', ''):
-            return data
-        elif choice == 'quit':
-            raise KeyboardInterrupt("User cancelled")
-        elif choice == 'raw':
-            if '_raw_text' in data:
-                print("\n=== Raw OCR Text ===")
-                print(data['_raw_text'])
-                print("=== End Raw Text ===\n")
-            else:
-                print("Raw text not available.")
-        else:
-            data = edit_field(data, choice)
+    restore_completion = _enable_field_completion(
+        [key for key in data if not key.startswith('_')]
+    )
 
-    return data
+    try:
+        show_table = True
+        while True:
+            # Only redraw the table when something changed since it was shown
+            if show_table:
+                print_table(data)
+                rendered = dict(data)
+                lower_index = {key.lower(): key for key in data}
+            print("\nOptions:")
+            print("  - Enter a field name to edit it")
+            print("  - Type 'ok' or press Enter to continue")
+            print("  - Type 'raw' to see raw OCR text (if available)")
+            print("  - Type 'quit' to cancel")
+
+            choice = input("\nEdit a field? ").strip().lower()
+
+            if choice in ('ok', ''):
+                return data
+            elif choice == 'quit':
+                raise KeyboardInterrupt("User cancelled")
+            elif choice == 'raw':
+                if '_raw_text' in data:
+                    print("\n=== Raw OCR Text ===")
+                    print(data['_raw_text'])
+                    print("=== End Raw Text ===\n")
+                    # Raw text scrolls the table off screen
+                    show_table = True
+                else:
+                    print("Raw text not available.")
+                    show_table = False
+            else:
+                data = edit_field(data, choice, lower_index)
+                show_table = data != rendered
+    finally:
+        if restore_completion:
+            restore_completion()
 
 
 def select_from_list(
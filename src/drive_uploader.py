@@ -1,25 +1,52 @@
 """Google Drive uploader module for archiving attachments."""
 
+import functools
+import json
+import mimetypes
 import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
+import google_auth_httplib2
+import httplib2
 from google.oauth2.credentials import Credentials
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from googleapiclient.http import MediaFileUpload
 
 
+# Files at or below this size use a single multipart upload request;
+# resumable uploads cost an extra session-initiation round trip
+RESUMABLE_THRESHOLD_BYTES = 5 * 1024 * 1024  # 5MB
+
 class DriveUploader:
     """Upload and organize files in Google Drive."""
 
     SCOPES = ['https://www.googleapis.com/auth/drive.file']
 
+    MIME_TYPES = {
+        '.pdf': 'application/pdf',
+        '.png': 'image/png',
+        '.jpg': 'image/jpeg',
+        '.jpeg': 'image/jpeg',
+        '.gif': 'image/gif',
+        '.doc': 'application/msword',
+        '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+        '.xls': 'application/vnd.ms-excel',
+        '.xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    }
+
+    # Requests per batch call; larger batches are prone to 500 errors
+    FOLDER_BATCH_SIZE = 25
+
     def __init__(
         self,
         credentials: Credentials,
-        archive_folder_id: str
+        archive_folder_id: str,
+        max_workers: int = 4
     ):
         """
         Initialize Drive uploader.
@@ -27,23 +54,78 @@ class DriveUploader:
         Args:
             credentials: Google OAuth2 credentials
             archive_folder_id: ID of the archive folder in Drive
+            max_workers: Maximum number of concurrent uploads
         """
         self.archive_folder_id = archive_folder_id
-        self.service = build('drive', 'v3', credentials=credentials)
+        self.max_workers = max_workers
+        self._credentials = credentials
+        self.service = self._build_service()
         self._month_folder_cache = {}
+        # Serializes folder lookup/creation so parallel uploads don't race
+        # to create the same month folder
+        self._folder_lock = threading.Lock()
+        self._local = threading.local()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _build_service(self):
+        """Build a Drive service on its own HTTP client."""
+        http = google_auth_httplib2.AuthorizedHttp(
+            self._credentials,
+            http=httplib2.Http()
+        )
+        return build('drive', 'v3', http=http)
+
+    def _thread_service(self):
+        """
+        Get a Drive service for the current thread.
+
+        httplib2 is not thread-safe, so each worker thread builds its own
+        service instead of sharing self.service.
+        """
+        service = getattr(self._local, 'service', None)
+        if service is None:
+            service = self._build_service()
+            self._local.service = service
+        return service
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        Get the upload thread pool, creating it on first use.
+
+        The pool lives as long as the uploader so each worker's service (and
+        its open HTTPS connection) is reused across upload_attachments calls.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix='drive-upload'
+            )
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the upload thread pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
 
-    def _list_subfolders(self, parent_id: str) -> dict[str, str]:
+    def _list_subfolders(self, parent_id: str, name_clause: str = "") -> dict[str, str]:
         """
         List subfolders in a parent folder.
 
         Args:
             parent_id: ID of the parent folder
+            name_clause: Optional Drive query clause to filter by name
+                         (e.g., "name = 'JANUARY'")
 
         Returns:
-            Dict mapping normalized folder name to folder ID
+            Dict mapping folder name to folder ID
         """
+        query = f"'{parent_id}' in parents and mimeType='application/vnd.google-apps.folder' and trashed=false"
+        if name_clause:
+            query = f"{name_clause} and {query}"
+
         results = self.service.files().list(
-            q=f"'{parent_id}' in parents and mimeType='application/vnd.google-apps.folder' and trashed=false",
+            q=query,
             fields="files(id, name)",
             pageSize=100
         ).execute()
@@ -55,36 +137,85 @@ class DriveUploader:
 
         return folders
 
-    def _find_month_folder(self, month: str) -> Optional[str]:
+    def invalidate_cache(self) -> None:
+        """Clear cached month folder IDs so the next lookup queries Drive."""
+        with self._folder_lock:
+            self._month_folder_cache = {}
+
+    def _match_month_folder(self, month: str, folders: dict[str, str]) -> Optional[str]:
         """
-        Find the folder ID for a specific month.
+        Match a month against a set of folder names.
 
         Args:
             month: Month name (e.g., "December" or "DECEMBER")
+            folders: Dict mapping folder name to folder ID
 
         Returns:
             Folder ID if found, None otherwise
         """
-        # Always refresh the folder list to ensure we find existing folders
-        self._month_folder_cache = self._list_subfolders(self.archive_folder_id)
-
         # Normalize month: uppercase, strip whitespace
         month_normalized = month.strip().upper()
 
         # Look for exact match first (e.g., "DECEMBER")
-        for folder_name, folder_id in self._month_folder_cache.items():
+        for folder_name, folder_id in folders.items():
             folder_normalized = folder_name.strip().upper()
             if folder_normalized == month_normalized:
                 return folder_id
 
         # Fallback: partial match (e.g., "JANUARY" in "JANUARY 2025")
-        for folder_name, folder_id in self._month_folder_cache.items():
+        for folder_name, folder_id in folders.items():
             folder_normalized = folder_name.strip().upper()
             if month_normalized in folder_normalized or folder_normalized in month_normalized:
                 return folder_id
 
         return None
 
+    def _find_month_folder(self, month: str) -> Optional[str]:
+        """
+        Find the folder ID for a specific month.
+
+        Queries Drive for folders named after the month, and only lists the
+        whole archive folder when neither query matches. Found IDs are
+        cached per month.
+
+        Args:
+            month: Month name (e.g., "December" or "DECEMBER")
+
+        Returns:
+            Folder ID if found, None otherwise
+        """
+        month_normalized = month.strip().upper()
+        if month_normalized in self._month_folder_cache:
+            return self._month_folder_cache[month_normalized]
+
+        # Escape for Drive query string literals
+        month_escaped = month_normalized.replace('\\', '\\\\').replace("'", "\\'")
+
+        # Look for exact match first (e.g., "DECEMBER")
+        folders = self._list_subfolders(
+            self.archive_folder_id,
+            name_clause=f"name = '{month_escaped}'"
+        )
+        folder_id = self._match_month_folder(month_normalized, folders)
+
+        if folder_id is None:
+            # Fallback: partial match (e.g., "JANUARY" in "JANUARY 2025")
+            folders = self._list_subfolders(
+                self.archive_folder_id,
+                name_clause=f"name contains '{month_escaped}'"
+            )
+            folder_id = self._match_month_folder(month_normalized, folders)
+
+        if folder_id is None:
+            # Last resort: folder names contained in the month (e.g., "DEC",
+            # "SEPT") can't be expressed as a Drive query, so list them all
+            folders = self._list_subfolders(self.archive_folder_id)
+            folder_id = self._match_month_folder(month_normalized, folders)
+
+        if folder_id:
+            self._month_folder_cache[month_normalized] = folder_id
+        return folder_id
+
     def _get_or_create_month_folder(self, month: str) -> str:
         """
         Get existing month folder or create one.
@@ -99,23 +230,68 @@ class DriveUploader:
         if folder_id:
             return folder_id
 
-        # Create new folder with uppercase month name only
-        folder_name = month.upper()
-        file_metadata = {
-            'name': folder_name,
-            'mimeType': 'application/vnd.google-apps.folder',
-            'parents': [self.archive_folder_id]
-        }
-
         folder = self.service.files().create(
-            body=file_metadata,
+            body=self._month_folder_metadata(month),
             fields='id'
         ).execute()
 
         folder_id = folder.get('id')
-        self._month_folder_cache[folder_name] = folder_id
+        self._month_folder_cache[month.strip().upper()] = folder_id
         return folder_id
 
+    def _month_folder_metadata(self, month: str) -> dict:
+        """Build metadata for a new month folder."""
+        # Create new folder with uppercase month name only
+        return {
+            'name': month.upper(),
+            'mimeType': 'application/vnd.google-apps.folder',
+            'parents': [self.archive_folder_id]
+        }
+
+    def prepare_month_folders(self, months: list[str]) -> dict[str, str]:
+        """
+        Ensure folders exist for several months up front.
+
+        Missing folders are created with batched requests (one HTTP call
+        per FOLDER_BATCH_SIZE folders), so later uploads never block on
+        folder creation.
+
+        Args:
+            months: Month names (e.g., ["January", "February"])
+
+        Returns:
+            Dict mapping normalized month name to folder ID
+        """
+        with self._folder_lock:
+            # Deduplicate while preserving order
+            normalized = list(dict.fromkeys(m.strip().upper() for m in months if m.strip()))
+            missing = [m for m in normalized if self._find_month_folder(m) is None]
+
+            errors = []
+
+            def on_created(request_id, response, exception):
+                if exception is not None:
+                    errors.append(exception)
+                else:
+                    self._month_folder_cache[request_id] = response['id']
+
+            for start in range(0, len(missing), self.FOLDER_BATCH_SIZE):
+                batch = self.service.new_batch_http_request(callback=on_created)
+                for month in missing[start:start + self.FOLDER_BATCH_SIZE]:
+                    batch.add(
+                        self.service.files().create(
+                            body=self._month_folder_metadata(month),
+                            fields='id, name'
+                        ),
+                        request_id=month
+                    )
+                batch.execute()
+
+            if errors:
+                raise errors[0]
+
+            return {m: self._month_folder_cache[m] for m in normalized}
+
     def upload_attachment(
         self,
         file_path: Path,
@@ -140,7 +316,8 @@ class DriveUploader:
             ID of the uploaded file
         """
         # Get the month folder
-        folder_id = self._get_or_create_month_folder(month)
+        with self._folder_lock:
+            folder_id = self._get_or_create_month_folder(month)
 
         # Extract last name from requestor name
         last_name = self._extract_last_name(requestor_name)
@@ -164,10 +341,10 @@ class DriveUploader:
         media = MediaFileUpload(
             str(file_path),
             mimetype=mime_type,
-            resumable=True
+            resumable=file_path.stat().st_size > RESUMABLE_THRESHOLD_BYTES
         )
 
-        uploaded_file = self.service.files().create(
+        uploaded_file = self._thread_service().files().create(
             body=file_metadata,
             media_body=media,
             fields='id, webViewLink'
@@ -194,13 +371,17 @@ class DriveUploader:
         Returns:
             List of uploaded file IDs
         """
-        file_ids = []
-
-        for i, file_path in enumerate(file_paths, 1):
-            # Determine file type based on filename or default to Reimbursement
-            file_type = self._detect_file_type(file_path.name)
-
-            file_id = self.upload_attachment(
+        # Number files and detect their type (Invoice, Receipt, or
+        # Reimbursement) up front so indexes follow the input order
+        jobs = [
+            (i, file_path, self._detect_file_type(file_path.name))
+            for i, file_path in enumerate(file_paths, 1)
+        ]
+
+        executor = self._get_executor()
+        futures = [
+            executor.submit(
+                self.upload_attachment,
                 file_path=file_path,
                 entry_id=entry_id,
                 requestor_name=requestor_name,
@@ -208,9 +389,11 @@ class DriveUploader:
                 file_index=i,
                 file_type=file_type
             )
-            file_ids.append(file_id)
+            for i, file_path, file_type in jobs
+        ]
 
-        return file_ids
+        # Collect in submission order so IDs match file_paths
+        return [future.result() for future in futures]
 
     def _extract_last_name(self, full_name: str) -> str:
         """Extract last name from full name."""
@@ -236,18 +419,36 @@ class DriveUploader:
 
     def _get_mime_type(self, extension: str) -> str:
         """Get MIME type for file extension."""
-        mime_types = {
-            '.pdf': 'application/pdf',
-            '.png': 'image/png',
-            '.jpg': 'image/jpeg',
-            '.jpeg': 'image/jpeg',
-            '.gif': 'image/gif',
-            '.doc': 'application/msword',
-            '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-            '.xls': 'application/vnd.ms-excel',
-            '.xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-        }
-        return mime_types.get(extension, 'application/octet-stream')
+        return (
+            self.MIME_TYPES.get(extension)
+            or mimetypes.guess_type(f"file{extension}")[0]
+            or 'application/octet-stream'
+        )
+
+
+@functools.lru_cache(maxsize=8)
+def _load_token_credentials(token_path: Path, mtime: float) -> Credentials:
+    """
+    Load OAuth credentials from a token file.
+
+    Cached on (path, modification time) so repeated uploader construction
+    skips the disk read and parse until the token file changes.
+
+    Args:
+        token_path: Path to the token file (JSON or legacy pickle)
+        mtime: Modification time of the token file (cache key only)
+
+    Returns:
+        OAuth2 credentials
+    """
+    data = token_path.read_bytes()
+
+    # Pickle streams start with the PROTO opcode (0x80)
+    if data[:1] == b'\x80':
+        import pickle
+        return pickle.loads(data)
+
+    return Credentials.from_authorized_user_info(json.loads(data))
 
 
 def create_drive_uploader_from_gmail_token(
@@ -260,18 +461,16 @@ def create_drive_uploader_from_gmail_token(
     Note: The token must have been created with Drive scope included.
 
     Args:
-        token_path: Path to the Gmail OAuth token pickle file
+        token_path: Path to the Gmail OAuth token file (authorized-user JSON,
+                    or a legacy pickle file)
         archive_folder_id: ID of the archive folder
 
     Returns:
         Configured DriveUploader
     """
-    import pickle
-
     if not token_path.exists():
         raise FileNotFoundError(f"Token file not found: {token_path}")
 
-    with open(token_path, 'rb') as f:
-        creds = pickle.load(f)
+    creds = _load_token_credentials(token_path, token_path.stat().st_mtime)
 
     return DriveUploader(creds, archive_folder_id)
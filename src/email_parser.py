@@ -1,14 +1,36 @@
 """Email parser module for extracting data and attachments from .eml files."""
 
-import email
+import binascii
 import os
+import re
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from email import policy
+from email.message import EmailMessage
+from email.parser import BytesParser
 from email.utils import parseaddr, parsedate_to_datetime
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
+
+
+# Maximum threads used to write one email's attachments to disk
+MAX_WRITE_WORKERS = 4
+
+# Maximum threads used by parse_eml_files
+MAX_PARSE_WORKERS = 16
+
+# Encoded characters decoded per step when streaming base64 attachments
+BASE64_CHUNK_SIZE = 64 * 1024
+
+# Characters outside the base64 alphabet, which decoders skip
+_NON_BASE64_RE = re.compile(r'[^A-Za-z0-9+/=]+')
+
+# Characters not allowed in filenames on Windows, mapped to '_'
+_SANITIZE_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+# Content-Type name parameter (e.g., name="form.pdf")
+_NAME_PARAM_RE = re.compile(r'name="?([^";\n]+)"?')
 
 
 @dataclass
@@ -40,9 +62,95 @@ def parse_eml_file(eml_path: str | Path) -> EmailData:
     if not eml_path.exists():
         raise FileNotFoundError(f"Email file not found: {eml_path}")
 
+    # BytesParser feeds the file to the parser incrementally
+    with open(eml_path, 'rb') as f:
+        msg = BytesParser(policy=policy.default).parse(f)
+
+    sender_name, sender_email, subject, email_date = _extract_headers(msg)
+
+    # Extract body text and PDF attachments
+    body_text, pdf_paths = _split_parts(msg, eml_path.stem)
+
+    return EmailData(
+        sender_name=sender_name,
+        sender_email=sender_email,
+        subject=subject,
+        date=email_date,
+        body_text=body_text,
+        pdf_paths=pdf_paths
+    )
+
+
+def parse_eml_files(eml_paths: list[str | Path]) -> list[EmailData]:
+    """
+    Parse several .eml files concurrently.
+
+    Reading files and writing their attachments is I/O bound, so a thread
+    pool overlaps the disk work of different emails.
+
+    Args:
+        eml_paths: Paths to the .eml files
+
+    Returns:
+        EmailData objects in the same order as eml_paths
+
+    Raises:
+        FileNotFoundError: If any .eml file doesn't exist
+    """
+    if not eml_paths:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(MAX_PARSE_WORKERS, len(eml_paths))) as executor:
+        return list(executor.map(parse_eml_file, eml_paths))
+
+
+def parse_eml_headers(eml_path: str | Path) -> EmailData:
+    """
+    Parse only the headers of an .eml file.
+
+    Reads up to the blank line ending the header block, so the body and
+    attachments are never read or decoded. Useful for filtering emails by
+    sender, subject or date before fully parsing them.
+
+    Args:
+        eml_path: Path to the .eml file
+
+    Returns:
+        EmailData with empty body_text and pdf_paths
+
+    Raises:
+        FileNotFoundError: If the .eml file doesn't exist
+    """
+    eml_path = Path(eml_path)
+    if not eml_path.exists():
+        raise FileNotFoundError(f"Email file not found: {eml_path}")
+
+    header_lines = []
     with open(eml_path, 'rb') as f:
-        msg = email.message_from_binary_file(f, policy=policy.default)
+        for line in f:
+            if line in (b'\r\n', b'\n'):
+                break
+            header_lines.append(line)
+
+    msg = BytesParser(policy=policy.default).parsebytes(
+        b''.join(header_lines),
+        headersonly=True
+    )
+
+    sender_name, sender_email, subject, email_date = _extract_headers(msg)
+
+    return EmailData(
+        sender_name=sender_name,
+        sender_email=sender_email,
+        subject=subject,
+        date=email_date,
+        body_text='',
+        pdf_paths=[]
+    )
 
+
+def _extract_headers(msg: EmailMessage) -> tuple[str, str, str, Optional[datetime]]:
+    """Extract sender name, sender email, subject and date from headers."""
     # Extract sender information
     sender_name, sender_email = parseaddr(msg.get('From', ''))
 
@@ -58,106 +166,182 @@ def parse_eml_file(eml_path: str | Path) -> EmailData:
     # Extract subject
     subject = msg.get('Subject', '')
 
-    # Extract body text
-    body_text = _extract_body_text(msg)
+    return sender_name, sender_email, subject, email_date
 
-    # Extract PDF attachments
-    pdf_paths = _extract_pdf_attachments(msg, eml_path.stem)
 
-    return EmailData(
-        sender_name=sender_name,
-        sender_email=sender_email,
-        subject=subject,
-        date=email_date,
-        body_text=body_text,
-        pdf_paths=pdf_paths
-    )
+def _split_parts(msg: EmailMessage, prefix: str) -> tuple[str, list[Path]]:
+    """
+    Extract body text and PDF attachments in a single pass over the message.
+
+    Args:
+        msg: Email message object
+        prefix: Prefix for temp file names
+
+    Returns:
+        Tuple of (plain text body, paths to extracted PDF files)
+    """
+    body_part = None
+    pdf_parts = []
+
+    # walk() also descends into nested multiparts and forwarded messages
+    for part in msg.walk():
+        if part.is_multipart():
+            continue
+
+        if part.is_attachment() or part.get_content_maintype() != 'text':
+            filename = _get_filename(part)
+            if filename and filename.lower().endswith('.pdf'):
+                pdf_parts.append((filename, part))
+        elif body_part is None and part.get_content_type() == 'text/plain':
+            body_part = part
 
+    body_text = _decode_text_part(body_part) if body_part is not None else ''
+    pdf_paths = _extract_pdf_attachments(pdf_parts, prefix)
 
-def _extract_body_text(msg: email.message.Message) -> str:
-    """Extract plain text body from email message."""
-    body_parts = []
-
-    if msg.is_multipart():
-        for part in msg.walk():
-            content_type = part.get_content_type()
-            content_disposition = str(part.get('Content-Disposition', ''))
-
-            # Skip attachments
-            if 'attachment' in content_disposition:
-                continue
-
-            if content_type == 'text/plain':
-                payload = part.get_payload(decode=True)
-                if payload:
-                    charset = part.get_content_charset() or 'utf-8'
-                    try:
-                        body_parts.append(payload.decode(charset, errors='replace'))
-                    except (UnicodeDecodeError, LookupError):
-                        body_parts.append(payload.decode('utf-8', errors='replace'))
-    else:
-        if msg.get_content_type() == 'text/plain':
-            payload = msg.get_payload(decode=True)
-            if payload:
-                charset = msg.get_content_charset() or 'utf-8'
-                try:
-                    body_parts.append(payload.decode(charset, errors='replace'))
-                except (UnicodeDecodeError, LookupError):
-                    body_parts.append(payload.decode('utf-8', errors='replace'))
-
-    return '\n'.join(body_parts)
-
-
-def _extract_pdf_attachments(msg: email.message.Message, prefix: str) -> list[Path]:
+    return body_text, pdf_paths
+
+
+def _decode_text_part(part: EmailMessage) -> str:
+    """Decode a text part using its declared charset."""
+    payload = part.get_payload(decode=True)
+    if not payload:
+        return ''
+
+    charset = part.get_content_charset() or 'utf-8'
+    try:
+        return payload.decode(charset, errors='replace')
+    except (UnicodeDecodeError, LookupError):
+        return payload.decode('utf-8', errors='replace')
+
+
+def _extract_pdf_attachments(
+    pdf_parts: list[tuple[str, EmailMessage]],
+    prefix: str
+) -> list[Path]:
     """
-    Extract PDF attachments from email and save to temp directory.
+    Save PDF attachment parts to temp directory.
 
     Args:
-        msg: Email message object
+        pdf_parts: List of (filename, part) tuples for PDF attachments
         prefix: Prefix for temp file names
 
     Returns:
         List of paths to extracted PDF files
     """
-    pdf_paths = []
     temp_dir = Path(tempfile.gettempdir()) / 'pta_parser'
     temp_dir.mkdir(exist_ok=True)
 
-    for part in msg.walk():
-        content_disposition = str(part.get('Content-Disposition', ''))
-        content_type = part.get_content_type()
-
-        # Check if this is a PDF attachment
-        is_pdf = (
-            content_type == 'application/pdf' or
-            content_type == 'application/octet-stream' and
-            _get_filename(part).lower().endswith('.pdf')
-        )
+    # Skip empty parts, then decode and write the rest concurrently
+    pending = [
+        (f"{prefix}_{_sanitize_filename(filename)}", part)
+        for filename, part in pdf_parts
+        if _has_payload(part)
+    ]
 
-        if 'attachment' in content_disposition or is_pdf:
-            filename = _get_filename(part)
-            if filename and filename.lower().endswith('.pdf'):
-                payload = part.get_payload(decode=True)
-                if payload:
-                    # Create unique filename
-                    safe_filename = _sanitize_filename(filename)
-                    pdf_path = temp_dir / f"{prefix}_{safe_filename}"
+    if len(pending) <= 1:
+        return [_write_unique_file(temp_dir, name, part) for name, part in pending]
+
+    with ThreadPoolExecutor(max_workers=min(len(pending), MAX_WRITE_WORKERS)) as executor:
+        return list(executor.map(
+            lambda item: _write_unique_file(temp_dir, *item),
+            pending
+        ))
+
+
+def _is_base64(part: EmailMessage) -> bool:
+    """Check whether a part's body is base64 encoded."""
+    return part.get('Content-Transfer-Encoding', '').strip().lower() == 'base64'
 
-                    # Handle duplicate filenames
-                    counter = 1
-                    original_path = pdf_path
-                    while pdf_path.exists():
-                        stem = original_path.stem
-                        pdf_path = temp_dir / f"{stem}_{counter}.pdf"
-                        counter += 1
 
-                    pdf_path.write_bytes(payload)
-                    pdf_paths.append(pdf_path)
+def _has_payload(part: EmailMessage) -> bool:
+    """Check whether a part has a non-empty body, without decoding base64."""
+    if _is_base64(part):
+        raw = part.get_payload(decode=False)
+        return isinstance(raw, str) and bool(raw.strip())
+    return bool(part.get_payload(decode=True))
+
+
+def _write_payload(part: EmailMessage, f: BinaryIO) -> None:
+    """
+    Decode a part's body into an open file.
+
+    Base64 bodies are decoded in chunks so the full decoded attachment is
+    never held in memory alongside the encoded text. Bodies the chunked
+    decoder can't handle are rewritten with get_payload(decode=True).
+    """
+    if not _is_base64(part):
+        f.write(part.get_payload(decode=True))
+        return
+
+    start_pos = f.tell()
+    try:
+        _write_base64(part.get_payload(decode=False), f)
+    except binascii.Error:
+        f.seek(start_pos)
+        f.truncate()
+        f.write(part.get_payload(decode=True))
+
+
+def _write_base64(raw: str, f: BinaryIO) -> None:
+    """Decode base64 text into an open file, BASE64_CHUNK_SIZE at a time."""
+    leftover = ''
+    for start in range(0, len(raw), BASE64_CHUNK_SIZE):
+        # Keep only base64 alphabet characters (the decoder skips the rest)
+        # and decode only whole 4-character groups
+        chunk = leftover + _NON_BASE64_RE.sub('', raw[start:start + BASE64_CHUNK_SIZE])
+        if '=' in chunk:
+            # Padding may end the data; decode the rest in one piece so
+            # anything after it is handled exactly as a single decode would
+            leftover = chunk + _NON_BASE64_RE.sub('', raw[start + BASE64_CHUNK_SIZE:])
+            break
+        usable = len(chunk) - len(chunk) % 4
+        f.write(binascii.a2b_base64(chunk[:usable]))
+        leftover = chunk[usable:]
+
+    if leftover:
+        # Tolerate missing padding, like get_payload(decode=True) does
+        f.write(binascii.a2b_base64(leftover + '=' * (-len(leftover) % 4)))
+
+
+def _write_unique_file(directory: Path, filename: str, part: EmailMessage) -> Path:
+    """
+    Write a part's decoded body to a new file, never overwriting one.
+
+    Uses the given filename when it's free; otherwise lets mkstemp pick a
+    unique name with the same stem and suffix. Both paths create the file
+    atomically, so concurrent runs can't clobber each other.
+
+    Args:
+        directory: Directory to write into
+        filename: Preferred filename
+        part: Email part whose body to write
+
+    Returns:
+        Path of the written file
+    """
+    path = directory / filename
+    try:
+        f = open(path, 'xb')
+    except FileExistsError:
+        fd, path_str = tempfile.mkstemp(
+            prefix=f"{path.stem}_",
+            suffix=path.suffix,
+            dir=str(directory)
+        )
+        path = Path(path_str)
+        f = os.fdopen(fd, 'wb')
 
-    return pdf_paths
+    try:
+        with f:
+            _write_payload(part, f)
+    except BaseException:
+        # Don't leave a half-written attachment behind
+        path.unlink(missing_ok=True)
+        raise
+    return path
 
 
-def _get_filename(part: email.message.Message) -> str:
+def _get_filename(part: EmailMessage) -> str:
     """Get filename from email part."""
     filename = part.get_filename()
     if filename:
@@ -166,8 +350,7 @@ def _get_filename(part: email.message.Message) -> str:
     # Try Content-Type name parameter
     content_type = part.get('Content-Type', '')
     if 'name=' in content_type:
-        import re
-        match = re.search(r'name="?([^";\n]+)"?', content_type)
+        match = _NAME_PARAM_RE.search(content_type)
         if match:
             return match.group(1)
 
@@ -177,8 +360,7 @@ def _get_filename(part: email.message.Message) -> str:
 def _sanitize_filename(filename: str) -> str:
     """Sanitize filename for safe filesystem use."""
     # Remove or replace problematic characters
-    import re
-    sanitized = re.sub(r'[<>:"/\\|?*]', '_', filename)
+    sanitized = filename.translate(_SANITIZE_TABLE)
     return sanitized.strip()
 
 
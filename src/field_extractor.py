@@ -1,11 +1,152 @@
 """Form field extractor module for parsing OCR text into structured data."""
 
 import re
-from dataclasses import dataclass, field
+import string
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from typing import Optional
 
 
-@dataclass
+# Number of distinct OCR texts whose extracted fields are kept
+_EXTRACT_CACHE_SIZE = 256
+
+# Literals that every pattern of an extractor requires. If an extractor's
+# anchor is absent from the text, none of its patterns can match, so the
+# extractor is skipped. Teacher/grade and event have label-free fallbacks
+# and are always run.
+_FIELD_ANCHORS = {
+    'requestor': re.compile(r'request|name|submitted', re.IGNORECASE),
+    'amount': re.compile(r'amount|total|\$', re.IGNORECASE),
+    'digit': re.compile(r'\d'),
+    'child_name': re.compile(r'child|student', re.IGNORECASE),
+    'reimbursement_type': re.compile(r'home|teacher|pta', re.IGNORECASE),
+    'payable_to': re.compile(r'pay', re.IGNORECASE),
+    'delivery': re.compile(r'mailbox|send|pick', re.IGNORECASE),
+}
+
+# Collapses runs of whitespace in extracted values
+_WS_RE = re.compile(r'\s+')
+
+_REQUESTOR_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'Check\s+Request(?:or|er)[\s:]*([A-Za-z\s]+?)(?:\n|$|Date)',
+    r'Request(?:or|er)[\s:]+([A-Za-z\s]+?)(?:\n|$)',
+    r'Name[\s:]+([A-Za-z\s]+?)(?:\n|$|Email|Phone)',
+    r'Submitted\s+[Bb]y[\s:]+([A-Za-z\s]+?)(?:\n|$)',
+))
+
+_DATE_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    # MM-DD-YYYY or MM/DD/YYYY
+    r'Date[\s:]*(\d{1,2}[-/]\d{1,2}[-/]\d{2,4})',
+    r'(\d{1,2}[-/]\d{1,2}[-/]\d{4})',
+    r'(\d{1,2}[-/]\d{1,2}[-/]\d{2})',
+    # Written months
+    r'Date[\s:]*([A-Za-z]+\s+\d{1,2},?\s+\d{4})',
+    r'([A-Za-z]+\s+\d{1,2},?\s+\d{4})',
+))
+
+_AMOUNT_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'Amount\s+Requested[\s:]*\$?([\d,]+\.?\d*)',
+    r'Amount[\s:]*\$?([\d,]+\.?\d*)',
+    r'Total[\s:]*\$?([\d,]+\.?\d*)',
+    r'\$\s*([\d,]+\.\d{2})',
+))
+
+# Standard email pattern
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+# Characters allowed before the '@' in _EMAIL_RE
+_EMAIL_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + '._%+-')
+
+# (XXX) XXX-XXXX, XXX-XXX-XXXX or XXXXXXXXXX - separators and parentheses
+# are optional, so this one pattern covers all three forms
+_PHONE_RE = re.compile(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+
+_CHILD_NAME_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r"Child(?:'s)?\s+Name[\s:]+([A-Za-z\s]+?)(?:\n|$|Teacher|Grade)",
+    r"Student(?:'s)?\s+Name[\s:]+([A-Za-z\s]+?)(?:\n|$|Teacher|Grade)",
+    r"Child[\s:]+([A-Za-z\s]+?)(?:\n|$)",
+))
+
+# Where the labeled teacher/grade patterns and the "Mrs./Mr./Ms./Miss"
+# fallback can start; none of these literals overlap, so finditer finds all
+_TEACHER_GRADE_ANCHORS_RE = re.compile(
+    r'(?P<teacher>teacher)|(?P<grade>grade)|(?P<title>m(?:rs?|s|iss))',
+    re.IGNORECASE
+)
+# Combined Teacher/Grade field - captures everything after "Teacher/Grade:"
+# until a clear field boundary
+_TEACHER_GRADE_COMBINED_RE = re.compile(
+    r'Teacher\s*/\s*Grade[\s:]+([^\n]+?)(?=\n\s*(?:Email|Phone|Child|Event|Amount|Payable|Delivery|Reimbursement)|$|\n\n)',
+    re.IGNORECASE
+)
+_TEACHER_RE = re.compile(r'\bTeacher[\s:]+([A-Za-z][A-Za-z.,\s]+?)(?=\n|$)', re.IGNORECASE)
+_GRADE_RE = re.compile(r'\bGrade[\s:]+([A-Za-z0-9][A-Za-z0-9\s]+?)(?=\n|$)', re.IGNORECASE)
+# "Mrs./Mr./Ms. LastName" followed by grade
+_TEACHER_THEN_GRADE_RE = re.compile(
+    r'((?:Mrs?\.?|Ms\.?|Miss)\s+[A-Z][a-z]+)[\s,/-]*((?:Pre-?)?K(?:indergarten)?|[1-5](?:st|nd|rd|th)?(?:\s*grade)?)',
+    re.IGNORECASE
+)
+# Grade followed by teacher name
+_GRADE_THEN_TEACHER_RE = re.compile(
+    r'\b((?:Pre-?)?K(?:indergarten)?|[1-5](?:st|nd|rd|th)?)\b[\s,/-]+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)'
+)
+
+# Checkbox indicators or explicit mentions, matched against lowercased text.
+# Each pattern is paired with a literal it requires, checked with a fast
+# substring test before running the regex.
+_REIMBURSEMENT_TYPE_PATTERNS = tuple((literal, re.compile(p), type_name) for literal, p, type_name in (
+    ('home', r'(?:☑|✓|✔|x|\[x\])\s*home\s*room', 'Home Room Parent'),
+    ('teacher', r'(?:☑|✓|✔|x|\[x\])\s*teacher', 'Teacher'),
+    ('program', r'(?:☑|✓|✔|x|\[x\])\s*pta\s*program', 'PTA Program'),
+    ('reimbursement', r'home\s*room\s*parent\s*reimbursement', 'Home Room Parent'),
+    ('reimbursement', r'teacher\s*reimbursement', 'Teacher'),
+    ('reimbursement', r'pta\s*program\s*reimbursement', 'PTA Program'),
+    ('reimbursement', r'reimbursement\s*type[\s:]*home\s*room', 'Home Room Parent'),
+    ('reimbursement', r'reimbursement\s*type[\s:]*teacher', 'Teacher'),
+    ('reimbursement', r'reimbursement\s*type[\s:]*pta', 'PTA Program'),
+))
+
+_EVENT_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'Event[\s:]+([A-Za-z\s]+?)(?:\n|$|Amount)',
+    r'For[\s:]+([A-Za-z\s]+?(?:Party|Event|Activity))(?:\n|$)',
+    r'Purpose[\s:]+([A-Za-z\s]+?)(?:\n|$)',
+))
+# Common event names, each paired with a lowercase literal it requires so
+# names absent from the text are ruled out with a substring test
+_EVENT_NAME_PATTERNS = tuple((literal, re.compile(p, re.IGNORECASE)) for literal, p in (
+    ('winter', r'(Winter\s+Party)'),
+    ('fall', r'(Fall\s+Party)'),
+    ('spring', r'(Spring\s+Party)'),
+    ('valentine', r'(Valentine(?:\'?s)?\s+(?:Day\s+)?Party)'),
+    ('halloween', r'(Halloween\s+Party)'),
+    ('year', r'(End\s+of\s+Year\s+Party)'),
+    ('field', r'(Field\s+Day)'),
+    ('appreciation', r'(Teacher\s+Appreciation)'),
+))
+_EVENT_LABEL_RE = re.compile(r'^Event[\s:]+', re.IGNORECASE)
+_FOR_LABEL_RE = re.compile(r'^For[\s:]+', re.IGNORECASE)
+
+_PAYABLE_TO_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'Make\s+Check\s+Payable\s+To[\s:]+([A-Za-z\s]+?)(?:\n|$)',
+    r'Payable\s+To[\s:]+([A-Za-z\s]+?)(?:\n|$)',
+    r'Pay\s+To[\s:]+([A-Za-z\s]+?)(?:\n|$)',
+))
+
+# Matched against lowercased text, each paired with a literal it requires.
+# A pattern of None means the literal alone is enough.
+_DELIVERY_PATTERNS = tuple(
+    (literal, re.compile(p) if p else None, delivery_type)
+    for literal, p, delivery_type in (
+        ('mailbox', r'(?:☑|✓|✔|x|\[x\])\s*(?:teacher\'?s?\s*)?mailbox', 'Teacher mailbox'),
+        ('send', r'(?:☑|✓|✔|x|\[x\])\s*send\s*home\s*with\s*child', 'Send home with child'),
+        ('pick', r'(?:☑|✓|✔|x|\[x\])\s*(?:i\'?ll\s*)?pick\s*(?:it\s*)?up', 'Pickup'),
+        ('mailbox', None, 'Teacher mailbox'),
+        ('send', r'send\s*home', 'Send home with child'),
+        ('pick', r'pick\s*up', 'Pickup'),
+    )
+)
+
+
+@dataclass(slots=True)
 class FormData:
     """Extracted form field data."""
     requestor: str = ""
@@ -27,48 +168,90 @@ def extract_fields(ocr_text: str) -> FormData:
     """
     Extract form fields from OCR text.
 
+    Results are cached by text, so reprocessing the same form (retries,
+    re-fetched messages) skips the pattern matching.
+
     Args:
         ocr_text: Raw text from OCR processing
 
     Returns:
         FormData with extracted fields
     """
+    # Return a copy so callers can't modify the cached result
+    return replace(_extract_fields(ocr_text))
+
+
+@lru_cache(maxsize=_EXTRACT_CACHE_SIZE)
+def _extract_fields(ocr_text: str) -> FormData:
+    """Extract form fields from OCR text (cached; see extract_fields)."""
     form_data = FormData(raw_text=ocr_text)
 
     # Normalize text for easier parsing
     text = ocr_text.replace('\r\n', '\n')
 
-    # Extract each field
-    form_data.requestor = _extract_requestor(text)
-    form_data.date = _extract_date(text)
-    form_data.amount = _extract_amount(text)
-    form_data.email = _extract_email(text)
-    form_data.phone = _extract_phone(text)
-    form_data.child_name = _extract_child_name(text)
+    # Blank pages or failed OCR: no pattern can match whitespace alone
+    if not text or text.isspace():
+        return form_data
+
+    # Lowercase once for the extractors that match against lowercased text
+    text_lower = text.lower()
+
+    # Find which extractors can possibly match
+    anchors = _find_field_anchors(text)
+
+    # Extract each field, skipping extractors whose anchors are absent
+    if 'requestor' in anchors:
+        form_data.requestor = _extract_requestor(text)
+    if 'digit' in anchors:
+        form_data.date = _extract_date(text)
+    if 'amount' in anchors:
+        form_data.amount = _extract_amount(text)
+    if 'email' in anchors:
+        form_data.email = _extract_email(text)
+    if 'digit' in anchors:
+        form_data.phone = _extract_phone(text)
+    if 'child_name' in anchors:
+        form_data.child_name = _extract_child_name(text)
     form_data.teacher_grade = _extract_teacher_grade(text)
-    form_data.reimbursement_type = _extract_reimbursement_type(text)
-    form_data.event = _extract_event(text)
-    form_data.payable_to = _extract_payable_to(text)
-    form_data.delivery = _extract_delivery(text)
+    if 'reimbursement_type' in anchors:
+        form_data.reimbursement_type = _extract_reimbursement_type(text_lower)
+    form_data.event = _extract_event(text, text_lower)
+    if 'payable_to' in anchors:
+        form_data.payable_to = _extract_payable_to(text)
+    if 'delivery' in anchors:
+        form_data.delivery = _extract_delivery(text_lower)
 
     return form_data
 
 
+def _find_field_anchors(text: str) -> set[str]:
+    """
+    Find which field anchors occur in the text.
+
+    Each anchor search stops at its first hit, so present fields cost
+    almost nothing and absent fields cost one scan instead of one per
+    pattern.
+
+    Args:
+        text: Normalized OCR text
+
+    Returns:
+        Set of _FIELD_ANCHORS names present in the text
+    """
+    anchors = {name for name, pattern in _FIELD_ANCHORS.items() if pattern.search(text)}
+    if '@' in text:
+        anchors.add('email')
+    return anchors
+
+
 def _extract_requestor(text: str) -> str:
     """Extract the check requestor name."""
-    patterns = [
-        r'Check\s+Request(?:or|er)[\s:]*([A-Za-z\s]+?)(?:\n|$|Date)',
-        r'Request(?:or|er)[\s:]+([A-Za-z\s]+?)(?:\n|$)',
-        r'Name[\s:]+([A-Za-z\s]+?)(?:\n|$|Email|Phone)',
-        r'Submitted\s+[Bb]y[\s:]+([A-Za-z\s]+?)(?:\n|$)',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _REQUESTOR_PATTERNS:
+        match = pattern.search(text)
         if match:
             name = match.group(1).strip()
             # Clean up common OCR artifacts
-            name = re.sub(r'\s+', ' ', name)
+            name = _WS_RE.sub(' ', name)
             if name and len(name) > 1:
                 return name
 
@@ -77,18 +260,8 @@ def _extract_requestor(text: str) -> str:
 
 def _extract_date(text: str) -> str:
     """Extract the date from the form."""
-    patterns = [
-        # MM-DD-YYYY or MM/DD/YYYY
-        r'Date[\s:]*(\d{1,2}[-/]\d{1,2}[-/]\d{2,4})',
-        r'(\d{1,2}[-/]\d{1,2}[-/]\d{4})',
-        r'(\d{1,2}[-/]\d{1,2}[-/]\d{2})',
-        # Written months
-        r'Date[\s:]*([A-Za-z]+\s+\d{1,2},?\s+\d{4})',
-        r'([A-Za-z]+\s+\d{1,2},?\s+\d{4})',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _DATE_PATTERNS:
+        match = pattern.search(text)
         if match:
             return match.group(1).strip()
 
@@ -97,15 +270,8 @@ def _extract_date(text: str) -> str:
 
 def _extract_amount(text: str) -> str:
     """Extract the amount requested."""
-    patterns = [
-        r'Amount\s+Requested[\s:]*\$?([\d,]+\.?\d*)',
-        r'Amount[\s:]*\$?([\d,]+\.?\d*)',
-        r'Total[\s:]*\$?([\d,]+\.?\d*)',
-        r'\$\s*([\d,]+\.\d{2})',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _AMOUNT_PATTERNS:
+        match = pattern.search(text)
         if match:
             amount = match.group(1).strip()
             # Ensure proper formatting
@@ -123,46 +289,39 @@ def _extract_amount(text: str) -> str:
 
 def _extract_email(text: str) -> str:
     """Extract email address."""
-    # Standard email pattern
-    pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-    match = re.search(pattern, text)
-    if match:
-        return match.group(0).lower()
+    # Every email contains '@', so only try the pattern where one occurs,
+    # starting at the run of local-part characters just before it
+    at = text.find('@')
+    while at >= 0:
+        start = at
+        while start > 0 and text[start - 1] in _EMAIL_LOCAL_CHARS:
+            start -= 1
+
+        match = _EMAIL_RE.match(text, start)
+        if match:
+            return match.group(0).lower()
+
+        at = text.find('@', at + 1)
+
     return ""
 
 
 def _extract_phone(text: str) -> str:
     """Extract phone number."""
-    patterns = [
-        # (XXX) XXX-XXXX
-        r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
-        # XXX-XXX-XXXX
-        r'\d{3}[-.\s]\d{3}[-.\s]\d{4}',
-        # XXXXXXXXXX
-        r'(?<!\d)\d{10}(?!\d)',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, text)
-        if match:
-            return match.group(0)
+    match = _PHONE_RE.search(text)
+    if match:
+        return match.group(0)
 
     return ""
 
 
 def _extract_child_name(text: str) -> str:
     """Extract child's name."""
-    patterns = [
-        r"Child(?:'s)?\s+Name[\s:]+([A-Za-z\s]+?)(?:\n|$|Teacher|Grade)",
-        r"Student(?:'s)?\s+Name[\s:]+([A-Za-z\s]+?)(?:\n|$|Teacher|Grade)",
-        r"Child[\s:]+([A-Za-z\s]+?)(?:\n|$)",
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _CHILD_NAME_PATTERNS:
+        match = pattern.search(text)
         if match:
             name = match.group(1).strip()
-            name = re.sub(r'\s+', ' ', name)
+            name = _WS_RE.sub(' ', name)
             if name and len(name) > 1:
                 return name
 
@@ -179,55 +338,57 @@ def _extract_teacher_grade(text: str) -> str:
     - "5th - Johnson"
     - "Teacher/Grade: Mrs, Lanford - Kindergarten"
     """
+    # One scan finds every place a labeled or title pattern could start;
+    # each pattern below is then only tried at those positions, which
+    # yields the same leftmost match as searching the whole text
+    starts = {'teacher': [], 'grade': [], 'title': []}
+    for anchor in _TEACHER_GRADE_ANCHORS_RE.finditer(text):
+        starts[anchor.lastgroup].append(anchor.start())
+
     # First, try to find the combined Teacher/Grade field - most reliable
-    # This captures everything after "Teacher/Grade:" until a clear field boundary
-    combined_pattern = r'Teacher\s*/\s*Grade[\s:]+([^\n]+?)(?=\n\s*(?:Email|Phone|Child|Event|Amount|Payable|Delivery|Reimbursement)|$|\n\n)'
-    match = re.search(combined_pattern, text, re.IGNORECASE)
+    match = _match_first(_TEACHER_GRADE_COMBINED_RE, text, starts['teacher'])
     if match:
         result = match.group(1).strip()
-        result = re.sub(r'\s+', ' ', result)
+        result = _WS_RE.sub(' ', result)
         if result and len(result) > 1:
             return result
 
     # Try to find separate Teacher and Grade fields and combine them
-    teacher_match = re.search(r'\bTeacher[\s:]+([A-Za-z][A-Za-z.,\s]+?)(?=\n|$)', text, re.IGNORECASE)
-    grade_match = re.search(r'\bGrade[\s:]+([A-Za-z0-9][A-Za-z0-9\s]+?)(?=\n|$)', text, re.IGNORECASE)
+    teacher_match = _match_first(_TEACHER_RE, text, starts['teacher'])
+    grade_match = _match_first(_GRADE_RE, text, starts['grade'])
 
     if teacher_match and grade_match:
         teacher = teacher_match.group(1).strip()
         grade = grade_match.group(1).strip()
         # Clean up each part
-        teacher = re.sub(r'\s+', ' ', teacher)
-        grade = re.sub(r'\s+', ' ', grade)
+        teacher = _WS_RE.sub(' ', teacher)
+        grade = _WS_RE.sub(' ', grade)
         if teacher and grade:
             return f"{teacher} - {grade}"
 
     # Try just Teacher field
     if teacher_match:
         result = teacher_match.group(1).strip()
-        result = re.sub(r'\s+', ' ', result)
+        result = _WS_RE.sub(' ', result)
         if result and len(result) > 1:
             return result
 
     # Try just Grade field
     if grade_match:
         result = grade_match.group(1).strip()
-        result = re.sub(r'\s+', ' ', result)
+        result = _WS_RE.sub(' ', result)
         if result and len(result) > 1:
             return result
 
     # Fallback: look for common teacher/grade patterns anywhere
-    # Pattern for "Mrs./Mr./Ms. LastName" followed by grade
-    teacher_grade_pattern = r'((?:Mrs?\.?|Ms\.?|Miss)\s+[A-Z][a-z]+)[\s,/-]*((?:Pre-?)?K(?:indergarten)?|[1-5](?:st|nd|rd|th)?(?:\s*grade)?)'
-    match = re.search(teacher_grade_pattern, text, re.IGNORECASE)
+    match = _match_first(_TEACHER_THEN_GRADE_RE, text, starts['title'])
     if match:
         teacher = match.group(1).strip()
         grade = match.group(2).strip()
         return f"{teacher} - {grade}"
 
     # Fallback: grade followed by teacher name
-    grade_teacher_pattern = r'\b((?:Pre-?)?K(?:indergarten)?|[1-5](?:st|nd|rd|th)?)\b[\s,/-]+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)'
-    match = re.search(grade_teacher_pattern, text)
+    match = _GRADE_THEN_TEACHER_RE.search(text)
     if match:
         grade = match.group(1)
         teacher = match.group(2)
@@ -236,93 +397,69 @@ def _extract_teacher_grade(text: str) -> str:
     return ""
 
 
-def _extract_reimbursement_type(text: str) -> str:
-    """Extract reimbursement type (Home Room, Teacher, PTA Program)."""
-    text_lower = text.lower()
+def _match_first(
+    pattern: re.Pattern,
+    text: str,
+    starts: list[int]
+) -> Optional[re.Match]:
+    """Return the first match of pattern anchored at one of the start positions."""
+    for start in starts:
+        match = pattern.match(text, start)
+        if match:
+            return match
+    return None
+
 
-    # Look for checkbox indicators or explicit mentions
-    type_patterns = [
-        (r'(?:☑|✓|✔|x|\[x\])\s*home\s*room', 'Home Room Parent'),
-        (r'(?:☑|✓|✔|x|\[x\])\s*teacher', 'Teacher'),
-        (r'(?:☑|✓|✔|x|\[x\])\s*pta\s*program', 'PTA Program'),
-        (r'home\s*room\s*parent\s*reimbursement', 'Home Room Parent'),
-        (r'teacher\s*reimbursement', 'Teacher'),
-        (r'pta\s*program\s*reimbursement', 'PTA Program'),
-        (r'reimbursement\s*type[\s:]*home\s*room', 'Home Room Parent'),
-        (r'reimbursement\s*type[\s:]*teacher', 'Teacher'),
-        (r'reimbursement\s*type[\s:]*pta', 'PTA Program'),
-    ]
-
-    for pattern, type_name in type_patterns:
-        if re.search(pattern, text_lower):
+def _extract_reimbursement_type(text_lower: str) -> str:
+    """Extract reimbursement type (Home Room, Teacher, PTA Program) from lowercased text."""
+    for literal, pattern, type_name in _REIMBURSEMENT_TYPE_PATTERNS:
+        if literal in text_lower and pattern.search(text_lower):
             return type_name
 
     return ""
 
 
-def _extract_event(text: str) -> str:
+def _extract_event(text: str, text_lower: str) -> str:
     """Extract event name."""
-    patterns = [
-        r'Event[\s:]+([A-Za-z\s]+?)(?:\n|$|Amount)',
-        r'For[\s:]+([A-Za-z\s]+?(?:Party|Event|Activity))(?:\n|$)',
-        r'Purpose[\s:]+([A-Za-z\s]+?)(?:\n|$)',
-        # Common event names
-        r'(Winter\s+Party)',
-        r'(Fall\s+Party)',
-        r'(Spring\s+Party)',
-        r'(Valentine(?:\'?s)?\s+(?:Day\s+)?Party)',
-        r'(Halloween\s+Party)',
-        r'(End\s+of\s+Year\s+Party)',
-        r'(Field\s+Day)',
-        r'(Teacher\s+Appreciation)',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _EVENT_PATTERNS:
+        match = pattern.search(text)
         if match:
             event = match.group(1).strip() if match.lastindex else match.group(0).strip()
-            event = re.sub(r'^Event[\s:]+', '', event, flags=re.IGNORECASE)
-            event = re.sub(r'^For[\s:]+', '', event, flags=re.IGNORECASE)
+            event = _EVENT_LABEL_RE.sub('', event)
+            event = _FOR_LABEL_RE.sub('', event)
             if event and len(event) > 2:
                 return event
 
+    # The literal test is only exact for ASCII text: IGNORECASE also lets
+    # 'ſ', 'ı' and 'İ' match 's' and 'i', which lower() doesn't map
+    prefilter = text_lower.isascii()
+    for literal, pattern in _EVENT_NAME_PATTERNS:
+        if prefilter and literal not in text_lower:
+            continue
+        match = pattern.search(text)
+        if match:
+            return match.group(1).strip()
+
     return ""
 
 
 def _extract_payable_to(text: str) -> str:
     """Extract 'Make Check Payable To' name."""
-    patterns = [
-        r'Make\s+Check\s+Payable\s+To[\s:]+([A-Za-z\s]+?)(?:\n|$)',
-        r'Payable\s+To[\s:]+([A-Za-z\s]+?)(?:\n|$)',
-        r'Pay\s+To[\s:]+([A-Za-z\s]+?)(?:\n|$)',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _PAYABLE_TO_PATTERNS:
+        match = pattern.search(text)
         if match:
             name = match.group(1).strip()
-            name = re.sub(r'\s+', ' ', name)
+            name = _WS_RE.sub(' ', name)
             if name and len(name) > 1:
                 return name
 
     return ""
 
 
-def _extract_delivery(text: str) -> str:
-    """Extract delivery preference."""
-    text_lower = text.lower()
-
-    delivery_patterns = [
-        (r'(?:☑|✓|✔|x|\[x\])\s*(?:teacher\'?s?\s*)?mailbox', 'Teacher mailbox'),
-        (r'(?:☑|✓|✔|x|\[x\])\s*send\s*home\s*with\s*child', 'Send home with child'),
-        (r'(?:☑|✓|✔|x|\[x\])\s*(?:i\'?ll\s*)?pick\s*(?:it\s*)?up', 'Pickup'),
-        (r'mailbox', 'Teacher mailbox'),
-        (r'send\s*home', 'Send home with child'),
-        (r'pick\s*up', 'Pickup'),
-    ]
-
-    for pattern, delivery_type in delivery_patterns:
-        if re.search(pattern, text_lower):
+def _extract_delivery(text_lower: str) -> str:
+    """Extract delivery preference from lowercased text."""
+    for literal, pattern, delivery_type in _DELIVERY_PATTERNS:
+        if literal in text_lower and (pattern is None or pattern.search(text_lower)):
             return delivery_type
 
     return ""
@@ -3,11 +3,15 @@
 import base64
 import os
 import pickle
+import re
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
@@ -21,6 +25,29 @@ SCOPES = [
     'https://www.googleapis.com/auth/drive.file'  # For uploading to Drive
 ]
 
+# Images can be OCR'd directly (Vision API supports these formats)
+IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.heic'})
+
+# Document files that contain text directly
+DOC_EXTENSIONS = frozenset({'.docx', '.doc'})
+
+# From header: "Name <email@example.com>" or just "email@example.com"
+_FROM_RE = re.compile(r'^"?([^"<]*)"?\s*<?([^>]+@[^>]+)>?$')
+
+# Requests per batch call (Gmail allows 100, but recommends 50 or fewer)
+BATCH_SIZE = 50
+
+# Maximum concurrent attachment downloads per message
+MAX_DOWNLOAD_WORKERS = 8
+
+# Encoded characters decoded per write (a multiple of 4)
+BASE64_CHUNK_SIZE = 64 * 1024
+
+# Partial response for list_messages: headers, snippet and part filenames
+# only, so message bodies aren't transferred. format='metadata' can't be
+# used because it omits the part tree needed for attachment types.
+LIST_MESSAGE_FIELDS = 'id,snippet,payload(headers,filename,parts(filename,parts(filename,parts)))'
+
 
 @dataclass
 class GmailMessage:
@@ -81,6 +108,9 @@ class GmailFetcher:
             self.token_path = self.oauth_credentials_path.parent / 'gmail_token.pickle'
 
         self._credentials = None
+        self._local = threading.local()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._used_names: Optional[set[str]] = None  # Loaded on first save
         self.service = self._authenticate()
 
     @property
@@ -146,14 +176,38 @@ class GmailFetcher:
             maxResults=max_results
         ).execute()
 
-        messages = []
-        for msg_info in results.get('messages', []):
-            msg = self.service.users().messages().get(
-                userId='me',
-                id=msg_info['id'],
-                format='full'
-            ).execute()
+        message_ids = [msg_info['id'] for msg_info in results.get('messages', [])]
+
+        # Fetch message details in batches instead of one request per message
+        fetched = {}
+        errors = []
+
+        def on_message(request_id, response, exception):
+            if exception is not None:
+                errors.append(exception)
+            else:
+                fetched[request_id] = response
+
+        for start in range(0, len(message_ids), BATCH_SIZE):
+            batch = self.service.new_batch_http_request(callback=on_message)
+            for message_id in message_ids[start:start + BATCH_SIZE]:
+                batch.add(
+                    self.service.users().messages().get(
+                        userId='me',
+                        id=message_id,
+                        format='full',
+                        fields=LIST_MESSAGE_FIELDS
+                    ),
+                    request_id=message_id
+                )
+            batch.execute()
+
+        if errors:
+            raise errors[0]
 
+        messages = []
+        for message_id in message_ids:
+            msg = fetched[message_id]
             headers = {h['name']: h['value'] for h in msg.get('payload', {}).get('headers', [])}
 
             # Parse sender
@@ -168,7 +222,7 @@ class GmailFetcher:
             attachment_types = self._get_attachment_types(msg.get('payload', {}))
 
             messages.append(GmailMessage(
-                id=msg_info['id'],
+                id=message_id,
                 subject=headers.get('Subject', '(no subject)'),
                 sender_name=sender_name,
                 sender_email=sender_email,
@@ -205,21 +259,24 @@ class GmailFetcher:
         date_str = headers.get('Date', '')
         msg_date = self._parse_date(date_str)
 
-        # Extract body text
-        body_text = self._extract_body(msg.get('payload', {}))
+        # Find body text and attachment parts in one pass
+        body_text, attachment_parts = self._scan_payload(msg.get('payload', {}))
 
         # Extract all attachments
-        all_attachments = self._extract_attachments(msg.get('payload', {}), message_id)
-
-        # Separate files by type for processing
-        # PDFs need conversion before OCR
-        pdf_paths = [p for p in all_attachments if p.suffix.lower() == '.pdf']
-        # Images can be OCR'd directly (Vision API supports these formats)
-        image_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.heic'}
-        image_paths = [p for p in all_attachments if p.suffix.lower() in image_extensions]
-        # Document files that contain text directly
-        doc_extensions = {'.docx', '.doc'}
-        doc_paths = [p for p in all_attachments if p.suffix.lower() in doc_extensions]
+        all_attachments = self._extract_attachments(attachment_parts, message_id)
+
+        # Separate files by type for processing, checking each suffix once
+        pdf_paths = []
+        image_paths = []
+        doc_paths = []
+        for path in all_attachments:
+            suffix = path.suffix.lower()
+            if suffix == '.pdf':
+                pdf_paths.append(path)
+            elif suffix in IMAGE_EXTENSIONS:
+                image_paths.append(path)
+            elif suffix in DOC_EXTENSIONS:
+                doc_paths.append(path)
 
         return FetchedEmail(
             message_id=message_id,
@@ -236,9 +293,7 @@ class GmailFetcher:
 
     def _parse_sender(self, from_header: str) -> tuple[str, str]:
         """Parse sender name and email from From header."""
-        import re
-        # Format: "Name <email@example.com>" or just "email@example.com"
-        match = re.match(r'^"?([^"<]*)"?\s*<?([^>]+@[^>]+)>?$', from_header.strip())
+        match = _FROM_RE.match(from_header.strip())
         if match:
             name = match.group(1).strip()
             email = match.group(2).strip()
@@ -247,144 +302,193 @@ class GmailFetcher:
 
     def _parse_date(self, date_str: str) -> Optional[datetime]:
         """Parse email date string."""
-        from email.utils import parsedate_to_datetime
         try:
             return parsedate_to_datetime(date_str)
         except (ValueError, TypeError):
             return None
 
-    def _get_attachment_types(self, payload: dict, types: set = None) -> list[str]:
+    def _get_attachment_types(self, payload: dict) -> list[str]:
         """Get list of attachment file extensions in payload."""
-        if types is None:
-            types = set()
-
-        parts = payload.get('parts', [])
-        if not parts:
-            # Single part message
-            filename = payload.get('filename', '')
-            if filename:
-                ext = Path(filename).suffix.lower()
-                if ext:
-                    types.add(ext)
-            return sorted(types)
-
-        for part in parts:
+        types = set()
+        for part in _walk_parts(payload):
             filename = part.get('filename', '')
             if filename:
                 ext = Path(filename).suffix.lower()
                 if ext:
                     types.add(ext)
-            # Check nested parts
-            if 'parts' in part:
-                self._get_attachment_types(part, types)
-
         return sorted(types)
 
-    def _extract_body(self, payload: dict) -> str:
-        """Extract plain text body from payload."""
-        parts = payload.get('parts', [])
+    def _scan_payload(self, payload: dict) -> tuple[str, list[tuple[dict, str]]]:
+        """
+        Extract plain text body and find attachment parts in one walk.
 
-        if not parts:
-            # Single part message
-            if payload.get('mimeType') == 'text/plain':
-                data = payload.get('body', {}).get('data', '')
-                if data:
-                    return base64.urlsafe_b64decode(data).decode('utf-8', errors='replace')
-            return ''
+        Returns:
+            Tuple of (body_text, [(part, filename), ...])
+        """
+        body_text = ''
+        attachment_parts = []
+        for part in _walk_parts(payload):
+            filename = part.get('filename', '')
+            if filename:  # Any file with a filename is an attachment
+                attachment_parts.append((part, filename))
 
-        # Multi-part message
-        for part in parts:
-            mime_type = part.get('mimeType', '')
-            if mime_type == 'text/plain':
+            # First text/plain part with data is the body
+            if not body_text and part.get('mimeType') == 'text/plain':
                 data = part.get('body', {}).get('data', '')
                 if data:
-                    return base64.urlsafe_b64decode(data).decode('utf-8', errors='replace')
-            # Check nested parts
-            if 'parts' in part:
-                text = self._extract_body(part)
-                if text:
-                    return text
+                    body_text = base64.urlsafe_b64decode(data).decode('utf-8', errors='replace')
 
-        return ''
+        return body_text, attachment_parts
 
-    def _extract_attachments(self, payload: dict, message_id: str) -> list[Path]:
-        """Extract all attachments and save to temp directory."""
+    def _extract_attachments(
+        self,
+        attachment_parts: list[tuple[dict, str]],
+        message_id: str
+    ) -> list[Path]:
+        """Download attachment parts and save to temp directory."""
         temp_dir = Path(tempfile.gettempdir()) / 'pta_parser' / 'gmail'
         temp_dir.mkdir(parents=True, exist_ok=True)
 
-        attachment_paths = []
-        self._find_and_save_attachments(payload, message_id, temp_dir, attachment_paths)
-        return attachment_paths
+        # Reserve output paths serially so duplicate filenames resolve in order
+        jobs = [
+            (part, self._reserve_attachment_path(message_id, filename, temp_dir))
+            for part, filename in attachment_parts
+            if _has_attachment_data(part)
+        ]
+
+        # Download concurrently; each is its own API request. Workers write
+        # their own download, so at most one encoded attachment per worker
+        # is held in memory.
+        if len(jobs) <= 1:
+            saved = [self._save_attachment(part, message_id, path) for part, path in jobs]
+        else:
+            saved = list(self._get_executor().map(
+                lambda job: self._save_attachment(job[0], message_id, job[1]),
+                jobs
+            ))
 
-    def _find_and_save_attachments(
-        self,
-        payload: dict,
-        message_id: str,
-        temp_dir: Path,
-        attachment_paths: list[Path]
-    ) -> None:
-        """Recursively find and save all attachments."""
-        parts = payload.get('parts', [])
-
-        if not parts:
-            # Check single part
-            filename = payload.get('filename', '')
-            if filename:  # Any file with a filename is an attachment
-                self._save_attachment(payload, message_id, filename, temp_dir, attachment_paths)
-            return
+        return [path for path in saved if path]
 
-        for part in parts:
-            filename = part.get('filename', '')
-            if filename:  # Any file with a filename is an attachment
-                self._save_attachment(part, message_id, filename, temp_dir, attachment_paths)
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        Get the download thread pool, creating it on first use.
+
+        The pool lives as long as the fetcher so each worker's service (and
+        its open HTTPS connection) is reused across fetch_message calls.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=MAX_DOWNLOAD_WORKERS,
+                thread_name_prefix='gmail-download'
+            )
+        return self._executor
 
-            # Check nested parts
-            if 'parts' in part:
-                self._find_and_save_attachments(part, message_id, temp_dir, attachment_paths)
+    def close(self) -> None:
+        """Shut down the download thread pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
 
-    def _save_attachment(
-        self,
-        part: dict,
-        message_id: str,
-        filename: str,
-        temp_dir: Path,
-        file_paths: list[Path]
-    ) -> None:
-        """Save a single attachment to disk."""
+    def _thread_service(self):
+        """
+        Get a Gmail service for the current thread.
+
+        httplib2 is not thread-safe, so worker threads build their own
+        service instead of sharing self.service.
+        """
+        if threading.current_thread() is threading.main_thread():
+            return self.service
+
+        service = getattr(self._local, 'service', None)
+        if service is None:
+            service = build('gmail', 'v1', credentials=self._credentials)
+            self._local.service = service
+        return service
+
+    def _fetch_attachment_data(self, part: dict, message_id: str) -> str:
+        """Get an attachment's base64url data, downloading it if needed."""
         body = part.get('body', {})
         attachment_id = body.get('attachmentId')
 
         if attachment_id:
             # Fetch attachment data
-            attachment = self.service.users().messages().attachments().get(
+            attachment = self._thread_service().users().messages().attachments().get(
                 userId='me',
                 messageId=message_id,
-                id=attachment_id
+                id=attachment_id,
+                fields='data'
             ).execute()
-            data = attachment.get('data', '')
-        else:
-            data = body.get('data', '')
-
-        if data:
-            file_data = base64.urlsafe_b64decode(data)
-
-            # Sanitize filename but preserve extension
-            name_part = Path(filename).stem
-            ext_part = Path(filename).suffix
-            safe_name = "".join(c for c in name_part if c.isalnum() or c in '._- ')
-            safe_filename = f"{safe_name}{ext_part}"
-
-            file_path = temp_dir / f"{message_id[:8]}_{safe_filename}"
-
-            # Handle duplicates
-            counter = 1
-            original = file_path
-            while file_path.exists():
-                file_path = temp_dir / f"{original.stem}_{counter}{original.suffix}"
-                counter += 1
+            return attachment.get('data', '')
+
+        return body.get('data', '')
+
+    def _reserve_attachment_path(self, message_id: str, filename: str, temp_dir: Path) -> Path:
+        """Pick an unused temp file path for an attachment."""
+        # Sanitize filename but preserve extension
+        name_part = Path(filename).stem
+        ext_part = Path(filename).suffix
+        safe_name = "".join(c for c in name_part if c.isalnum() or c in '._- ')
+        safe_filename = f"{safe_name}{ext_part}"
+
+        file_path = temp_dir / f"{message_id[:8]}_{safe_filename}"
+
+        # Handle duplicates against names already in the temp directory
+        if self._used_names is None:
+            self._used_names = {entry.name for entry in os.scandir(temp_dir)}
+        counter = 1
+        original = file_path
+        while file_path.name in self._used_names:
+            file_path = temp_dir / f"{original.stem}_{counter}{original.suffix}"
+            counter += 1
+        self._used_names.add(file_path.name)
+
+        return file_path
+
+    def _save_attachment(self, part: dict, message_id: str, file_path: Path) -> Optional[Path]:
+        """Save a single attachment to disk, returning its path if written."""
+        data = self._fetch_attachment_data(part, message_id)
+        if not data:
+            return None
 
-            file_path.write_bytes(file_data)
-            file_paths.append(file_path)
+        _write_base64url(data, file_path)
+        return file_path
+
+
+def _has_attachment_data(part: dict) -> bool:
+    """Check whether a part has inline data or a downloadable attachment."""
+    body = part.get('body', {})
+    return bool(body.get('attachmentId') or body.get('data'))
+
+
+def _walk_parts(payload: dict) -> Iterator[dict]:
+    """
+    Iterate over the MIME parts of a Gmail payload, depth first.
+
+    A multipart payload yields its nested parts in document order; a
+    single-part payload yields itself. Uses an explicit stack rather than
+    recursion.
+    """
+    stack = list(reversed(payload.get('parts') or ())) or [payload]
+    while stack:
+        part = stack.pop()
+        yield part
+        children = part.get('parts')
+        if children:
+            stack.extend(reversed(children))
+
+
+def _write_base64url(data: str, file_path: Path) -> None:
+    """
+    Decode base64url data into a file.
+
+    Data is decoded in chunks so the full decoded attachment is never held
+    in memory alongside the encoded string.
+    """
+    with open(file_path, 'wb') as f:
+        for start in range(0, len(data), BASE64_CHUNK_SIZE):
+            chunk = data[start:start + BASE64_CHUNK_SIZE]
+            # Only the final chunk can be short; tolerate missing padding
+            f.write(base64.urlsafe_b64decode(chunk + '=' * (-len(chunk) % 4)))
 
 
 def cleanup_fetched_files(file_paths: list[Path]) -> None:
@@ -1,8 +1,13 @@
 """Main CLI entry point for PTA Reimbursement Parser."""
 
 import argparse
+import io
+import os
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
 
 import yaml
 
@@ -16,8 +21,65 @@ from . import gmail_fetcher
 from . import drive_uploader
 from . import printer
 
+# Use libyaml's C loader when PyYAML was built with it
+try:
+    YAML_LOADER = yaml.CSafeLoader
+except AttributeError:
+    YAML_LOADER = yaml.SafeLoader
+
+# Defaults for optional config.yaml settings
+DEFAULT_SHEET_NAME = 'Income and Expenses'
+DEFAULT_PAYMENT_TYPES = ('Check', 'Debit', 'Amazon')
+
+
+@dataclass(frozen=True, slots=True)
+class AppConfig:
+    """Settings from config.yaml, resolved once when the file is loaded."""
+    credentials_file: Optional[str] = None  # google_cloud.credentials_file
+    spreadsheet_id: Optional[str] = None  # google_sheets.spreadsheet_id
+    sheet_name: str = DEFAULT_SHEET_NAME  # google_sheets.sheet_name
+    poppler_path: Optional[str] = None
+    auto_dpi: bool = False  # pdf.auto_dpi
+    gmail_oauth_credentials_file: Optional[str] = None  # gmail.oauth_credentials_file
+    archive_folder_id: Optional[str] = None  # google_drive.archive_folder_id
+    payment_types: tuple[str, ...] = DEFAULT_PAYMENT_TYPES  # field_mappings.*
+    budget_categories: tuple[str, ...] = ()
+    budget_items: tuple[str, ...] = ()
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'AppConfig':
+        """
+        Build settings from the parsed YAML.
+
+        Args:
+            data: Parsed config.yaml contents
+
+        Returns:
+            AppConfig with defaults for anything not set
+        """
+        google_cloud = data.get('google_cloud') or {}
+        google_sheets = data.get('google_sheets') or {}
+        gmail = data.get('gmail') or {}
+        google_drive = data.get('google_drive') or {}
+        pdf = data.get('pdf') or {}
+        field_mappings = data.get('field_mappings') or {}
+
+        return cls(
+            credentials_file=google_cloud.get('credentials_file'),
+            spreadsheet_id=google_sheets.get('spreadsheet_id'),
+            sheet_name=google_sheets.get('sheet_name', DEFAULT_SHEET_NAME),
+            poppler_path=data.get('poppler_path'),
+            auto_dpi=bool(pdf.get('auto_dpi', False)),
+            gmail_oauth_credentials_file=gmail.get('oauth_credentials_file'),
+            archive_folder_id=google_drive.get('archive_folder_id'),
+            # Keys present but left empty load as None
+            payment_types=tuple(field_mappings.get('payment_types', DEFAULT_PAYMENT_TYPES) or ()),
+            budget_categories=tuple(field_mappings.get('budget_categories') or ()),
+            budget_items=tuple(field_mappings.get('budget_items') or ()),
+        )
+
 
-def load_config(config_path: Path) -> dict:
+def load_config(config_path: Path) -> AppConfig:
     """Load configuration from YAML file."""
     if not config_path.exists():
         raise FileNotFoundError(
@@ -26,21 +88,80 @@ def load_config(config_path: Path) -> dict:
         )
 
     with open(config_path, 'r') as f:
-        return yaml.safe_load(f)
+        return AppConfig.from_dict(yaml.load(f, Loader=YAML_LOADER) or {})
+
+
+def create_sheets_writer(config: AppConfig) -> sheets_writer.SheetsWriter:
+    """Create a Sheets writer for the configured spreadsheet."""
+    return sheets_writer.SheetsWriter(
+        credentials_path=config.credentials_file,
+        spreadsheet_id=config.spreadsheet_id,
+        sheet_name=config.sheet_name
+    )
+
+
+def can_ocr_pdf_directly(pdf_path: Path, config: AppConfig) -> bool:
+    """
+    Check whether a PDF can be sent to Vision as-is instead of rendering pages.
+
+    Args:
+        pdf_path: Path to the PDF file
+        config: Application settings
+
+    Returns:
+        True if the PDF is within the direct PDF page and size limits
+    """
+    if pdf_path.stat().st_size > ocr_processor.MAX_DIRECT_PDF_BYTES:
+        return False
+
+    try:
+        page_count = pdf_processor.get_page_count(pdf_path, poppler_path=config.poppler_path)
+    except Exception:
+        # Let the image path report conversion problems
+        return False
+
+    return 0 < page_count <= ocr_processor.MAX_DIRECT_PDF_PAGES
+
+
+def combine_ocr_text(sections: list[list[str]], separator: str) -> str:
+    """
+    Combine the OCR text of several attachments into one string.
+
+    Pages are written straight into a single buffer, so the per-attachment
+    text is never built on its own.
+
+    Args:
+        sections: Page texts for each attachment
+        separator: Marker placed between attachments
+
+    Returns:
+        Combined text, with page break markers between pages
+    """
+    out = io.StringIO()
+    for i, pages in enumerate(sections):
+        if i:
+            out.write(separator)
+        for j, page in enumerate(pages):
+            if j:
+                out.write(ocr_processor.PAGE_SEPARATOR)
+            out.write(page)
+    return out.getvalue()
 
 
 def process_eml_file(
     eml_path: Path,
-    config: dict,
-    dry_run: bool = False
+    config: AppConfig,
+    dry_run: bool = False,
+    writer: Optional[sheets_writer.SheetsWriter] = None
 ) -> bool:
     """
     Process a single .eml file.
 
     Args:
         eml_path: Path to the .eml file
-        config: Configuration dictionary
+        config: Application settings
         dry_run: If True, don't write to Google Sheets
+        writer: Sheets writer to reuse (created on demand if not provided)
 
     Returns:
         True if processing was successful
@@ -63,32 +184,55 @@ def process_eml_file(
     print(f"  Found {len(email_data.pdf_paths)} PDF attachment(s)")
 
     # Process each PDF
-    all_ocr_text = []
+    all_ocr_text: list[list[str]] = []  # Page texts per attachment
     all_image_paths = []
 
+    # Step 2: Convert PDFs to images. Small PDFs go straight to Vision,
+    # the rest are rendered concurrently up front.
+    direct_pdfs = {p for p in email_data.pdf_paths if can_ocr_pdf_directly(p, config)}
+    render_pdfs = [p for p in email_data.pdf_paths if p not in direct_pdfs]
+    try:
+        rendered = pdf_processor.convert_pdfs_to_images(
+            render_pdfs, poppler_path=config.poppler_path, auto_dpi=config.auto_dpi
+        )
+    except RuntimeError as e:
+        cli_review.display_error(str(e))
+        return False
+    except Exception as e:
+        cli_review.display_error(f"Failed to convert PDF: {e}")
+        return False
+    page_images = dict(zip(render_pdfs, rendered))
+    for image_paths in rendered:
+        all_image_paths.extend(image_paths)
+
     for pdf_path in email_data.pdf_paths:
         print(f"\nExtracting: {pdf_path.name}")
 
-        # Step 2: Convert PDF to images
-        try:
-            poppler_path = config.get('poppler_path')
-            image_paths = pdf_processor.convert_pdf_to_images(pdf_path, poppler_path=poppler_path)
-            all_image_paths.extend(image_paths)
-            print(f"  Converted to {len(image_paths)} page(s)")
-        except RuntimeError as e:
-            cli_review.display_error(str(e))
-            return False
-        except Exception as e:
-            cli_review.display_error(f"Failed to convert PDF: {e}")
-            return False
+        if pdf_path in direct_pdfs:
+            try:
+                print("  Running OCR on PDF...")
+                credentials_path = config.credentials_file
+                vision_client = ocr_processor.initialize_vision_client(credentials_path)
+                ocr_result = ocr_processor.process_pdf_directly(vision_client, pdf_path)
+                all_ocr_text.append(ocr_result.pages)
+                print("  OCR complete.")
+            except Exception as e:
+                cli_review.display_error(f"OCR failed: {e}")
+                # Cleanup
+                pdf_processor.cleanup_images(all_image_paths)
+                return False
+            continue
+
+        image_paths = page_images[pdf_path]
+        print(f"  Converted to {len(image_paths)} page(s)")
 
         # Step 3: Run OCR
         try:
             print(f"  Running OCR on {len(image_paths)} page(s)...")
-            credentials_path = config['google_cloud']['credentials_file']
+            credentials_path = config.credentials_file
             vision_client = ocr_processor.initialize_vision_client(credentials_path)
             ocr_result = ocr_processor.process_images(vision_client, image_paths)
-            all_ocr_text.append(ocr_result.full_text)
+            all_ocr_text.append(ocr_result.pages)
             print("  OCR complete.")
         except Exception as e:
             cli_review.display_error(f"OCR failed: {e}")
@@ -97,7 +241,7 @@ def process_eml_file(
             return False
 
     # Combine OCR text from all PDFs
-    combined_ocr_text = "\n\n=== Next PDF ===\n\n".join(all_ocr_text)
+    combined_ocr_text = combine_ocr_text(all_ocr_text, "\n\n=== Next PDF ===\n\n")
 
     # Step 4: Extract form fields
     form_data = field_extractor.extract_fields(combined_ocr_text)
@@ -120,9 +264,9 @@ def process_eml_file(
     reviewed_data.pop('_raw_text', None)
 
     # Step 6: Select payment type, budget category and item
-    payment_types = config.get('field_mappings', {}).get('payment_types', ['Check', 'Debit', 'Amazon'])
-    budget_categories = config.get('field_mappings', {}).get('budget_categories', [])
-    budget_items = config.get('field_mappings', {}).get('budget_items', [])
+    payment_types = config.payment_types
+    budget_categories = config.budget_categories
+    budget_items = config.budget_items
 
     payment_type = cli_review.select_from_list(
         payment_types,
@@ -157,11 +301,8 @@ def process_eml_file(
     else:
         if cli_review.confirm_action("Add to spreadsheet?"):
             try:
-                writer = sheets_writer.SheetsWriter(
-                    credentials_path=config['google_cloud']['credentials_file'],
-                    spreadsheet_id=config['google_sheets']['spreadsheet_id'],
-                    sheet_name=config['google_sheets'].get('sheet_name', 'Income and Expenses')
-                )
+                if writer is None:
+                    writer = create_sheets_writer(config)
 
                 next_id = writer.get_next_id()
 
@@ -176,7 +317,7 @@ def process_eml_file(
 
                 row_num = writer.append_row(row)
                 cli_review.display_success(
-                    f"Added row #{next_id} to \"{config['google_sheets'].get('sheet_name', 'Income and Expenses')}\""
+                    f"Added row #{next_id} to \"{config.sheet_name}\""
                 )
 
             except Exception as e:
@@ -194,7 +335,7 @@ def process_eml_file(
 
 def process_folder(
     folder_path: Path,
-    config: dict,
+    config: AppConfig,
     dry_run: bool = False
 ) -> tuple[int, int]:
     """
@@ -202,7 +343,7 @@ def process_folder(
 
     Args:
         folder_path: Path to the folder
-        config: Configuration dictionary
+        config: Application settings
         dry_run: If True, don't write to Google Sheets
 
     Returns:
@@ -211,7 +352,11 @@ def process_folder(
     if not folder_path.is_dir():
         raise NotADirectoryError(f"Not a directory: {folder_path}")
 
-    eml_files = list(folder_path.glob("*.eml"))
+    # normcase makes the suffix check case-insensitive on Windows, like glob
+    eml_files = [
+        Path(entry.path) for entry in os.scandir(folder_path)
+        if os.path.normcase(entry.name).endswith('.eml') and entry.is_file()
+    ]
 
     if not eml_files:
         print(f"No .eml files found in {folder_path}")
@@ -222,9 +367,18 @@ def process_folder(
     successful = 0
     failed = 0
 
+    # One Sheets client for the whole batch instead of one per email
+    writer = None
+    if not dry_run:
+        try:
+            writer = create_sheets_writer(config)
+        except Exception:
+            # Each email retries and reports the error when it writes
+            writer = None
+
     for eml_file in eml_files:
         try:
-            if process_eml_file(eml_file, config, dry_run):
+            if process_eml_file(eml_file, config, dry_run, writer):
                 successful += 1
             else:
                 failed += 1
@@ -245,16 +399,16 @@ def process_folder(
     return (successful, failed)
 
 
-def list_gmail_messages(config: dict, query: str, max_results: int) -> None:
+def list_gmail_messages(config: AppConfig, query: str, max_results: int) -> None:
     """
     List Gmail messages matching a query.
 
     Args:
-        config: Configuration dictionary
+        config: Application settings
         query: Gmail search query
         max_results: Maximum number of messages to show
     """
-    oauth_path = config.get('gmail', {}).get('oauth_credentials_file')
+    oauth_path = config.gmail_oauth_credentials_file
     if not oauth_path:
         cli_review.display_error(
             "Gmail OAuth credentials not configured.\n"
@@ -291,9 +445,67 @@ def list_gmail_messages(config: dict, query: str, max_results: int) -> None:
         print()
 
 
+def archive_attachments(
+    credentials,
+    archive_folder_id: str,
+    file_paths: list[Path],
+    entry_id: int,
+    requestor_name: str,
+    month: str
+) -> list[str]:
+    """
+    Upload attachments to the month's folder in the Drive archive.
+
+    Args:
+        credentials: OAuth2 credentials with Drive access
+        archive_folder_id: ID of the Drive archive folder
+        file_paths: Attachments to upload
+        entry_id: Spreadsheet row ID used in file names
+        requestor_name: Requestor name used in file names
+        month: Archive month folder (e.g., "January")
+
+    Returns:
+        List of uploaded Drive file IDs
+    """
+    uploader = drive_uploader.DriveUploader(
+        credentials=credentials,
+        archive_folder_id=archive_folder_id
+    )
+    try:
+        return uploader.upload_attachments(
+            file_paths=file_paths,
+            entry_id=entry_id,
+            requestor_name=requestor_name,
+            month=month
+        )
+    finally:
+        uploader.close()
+
+
+def finish_drive_upload(upload: Future, archive_month: str) -> None:
+    """
+    Wait for a background Drive upload and report how it went.
+
+    Args:
+        upload: Future returned by submitting archive_attachments
+        archive_month: Archive month folder the files went to
+    """
+    if not upload.done():
+        cli_review.display_info("Waiting for Drive upload to finish...")
+    try:
+        file_ids = upload.result()
+    except Exception as e:
+        cli_review.display_error(f"Failed to upload to Drive: {e}")
+        # Continue even if Drive upload fails
+        return
+    cli_review.display_success(
+        f"Uploaded {len(file_ids)} file(s) to Drive archive ({archive_month.upper()})"
+    )
+
+
 def process_gmail_message(
     message_id: str,
-    config: dict,
+    config: AppConfig,
     dry_run: bool = False
 ) -> bool:
     """
@@ -301,13 +513,13 @@ def process_gmail_message(
 
     Args:
         message_id: Gmail message ID
-        config: Configuration dictionary
+        config: Application settings
         dry_run: If True, don't write to Google Sheets
 
     Returns:
         True if processing was successful
     """
-    oauth_path = config.get('gmail', {}).get('oauth_credentials_file')
+    oauth_path = config.gmail_oauth_credentials_file
     if not oauth_path:
         cli_review.display_error(
             "Gmail OAuth credentials not configured.\n"
@@ -328,6 +540,8 @@ def process_gmail_message(
     except Exception as e:
         cli_review.display_error(f"Failed to fetch message: {e}")
         return False
+    finally:
+        fetcher.close()
 
     print(f"  From: {email_data.sender_name} <{email_data.sender_email}>")
     print(f"  Subject: {email_data.subject}")
@@ -345,31 +559,53 @@ def process_gmail_message(
         print(f"  Found {len(email_data.doc_paths)} document attachment(s)")
 
     # Process all OCR-able files
-    all_ocr_text = []
+    all_ocr_text: list[list[str]] = []  # Page texts per attachment
     all_image_paths = []  # Track converted images for cleanup
 
-    # Process PDFs - convert to images first
+    # Process PDFs - small ones go straight to Vision, the rest are
+    # converted to images first, concurrently up front
+    direct_pdfs = {p for p in email_data.pdf_paths if can_ocr_pdf_directly(p, config)}
+    render_pdfs = [p for p in email_data.pdf_paths if p not in direct_pdfs]
+    try:
+        rendered = pdf_processor.convert_pdfs_to_images(
+            render_pdfs, poppler_path=config.poppler_path, auto_dpi=config.auto_dpi
+        )
+    except RuntimeError as e:
+        cli_review.display_error(str(e))
+        return False
+    except Exception as e:
+        cli_review.display_error(f"Failed to convert PDF: {e}")
+        return False
+    page_images = dict(zip(render_pdfs, rendered))
+    for image_paths in rendered:
+        all_image_paths.extend(image_paths)
+
     for pdf_path in email_data.pdf_paths:
         print(f"\nExtracting PDF: {pdf_path.name}")
 
-        try:
-            poppler_path = config.get('poppler_path')
-            image_paths = pdf_processor.convert_pdf_to_images(pdf_path, poppler_path=poppler_path)
-            all_image_paths.extend(image_paths)
-            print(f"  Converted to {len(image_paths)} page(s)")
-        except RuntimeError as e:
-            cli_review.display_error(str(e))
-            return False
-        except Exception as e:
-            cli_review.display_error(f"Failed to convert PDF: {e}")
-            return False
+        if pdf_path in direct_pdfs:
+            try:
+                print("  Running OCR on PDF...")
+                credentials_path = config.credentials_file
+                vision_client = ocr_processor.initialize_vision_client(credentials_path)
+                ocr_result = ocr_processor.process_pdf_directly(vision_client, pdf_path)
+                all_ocr_text.append(ocr_result.pages)
+                print("  OCR complete.")
+            except Exception as e:
+                cli_review.display_error(f"OCR failed: {e}")
+                pdf_processor.cleanup_images(all_image_paths)
+                return False
+            continue
+
+        image_paths = page_images[pdf_path]
+        print(f"  Converted to {len(image_paths)} page(s)")
 
         try:
             print(f"  Running OCR on {len(image_paths)} page(s)...")
-            credentials_path = config['google_cloud']['credentials_file']
+            credentials_path = config.credentials_file
             vision_client = ocr_processor.initialize_vision_client(credentials_path)
             ocr_result = ocr_processor.process_images(vision_client, image_paths)
-            all_ocr_text.append(ocr_result.full_text)
+            all_ocr_text.append(ocr_result.pages)
             print("  OCR complete.")
         except Exception as e:
             cli_review.display_error(f"OCR failed: {e}")
@@ -380,10 +616,10 @@ def process_gmail_message(
     if email_data.image_paths:
         print(f"\nProcessing {len(email_data.image_paths)} image attachment(s)...")
         try:
-            credentials_path = config['google_cloud']['credentials_file']
+            credentials_path = config.credentials_file
             vision_client = ocr_processor.initialize_vision_client(credentials_path)
             ocr_result = ocr_processor.process_images(vision_client, email_data.image_paths)
-            all_ocr_text.append(ocr_result.full_text)
+            all_ocr_text.append(ocr_result.pages)
             print("  OCR complete.")
         except Exception as e:
             cli_review.display_error(f"OCR failed: {e}")
@@ -396,14 +632,14 @@ def process_gmail_message(
         for doc_path in email_data.doc_paths:
             try:
                 doc_text = gmail_fetcher.extract_text_from_docx(doc_path)
-                all_ocr_text.append(doc_text)
+                all_ocr_text.append([doc_text])
                 print(f"  Extracted text from {doc_path.name}")
             except Exception as e:
                 cli_review.display_error(f"Failed to extract text: {e}")
                 pdf_processor.cleanup_images(all_image_paths)
                 return False
 
-    combined_ocr_text = "\n\n=== Next Attachment ===\n\n".join(all_ocr_text)
+    combined_ocr_text = combine_ocr_text(all_ocr_text, "\n\n=== Next Attachment ===\n\n")
 
     form_data = field_extractor.extract_fields(combined_ocr_text)
     data_dict = field_extractor.form_data_to_dict(form_data)
@@ -419,9 +655,9 @@ def process_gmail_message(
 
     reviewed_data.pop('_raw_text', None)
 
-    payment_types = config.get('field_mappings', {}).get('payment_types', ['Check', 'Debit', 'Amazon'])
-    budget_categories = config.get('field_mappings', {}).get('budget_categories', [])
-    budget_items = config.get('field_mappings', {}).get('budget_items', [])
+    payment_types = config.payment_types
+    budget_categories = config.budget_categories
+    budget_items = config.budget_items
 
     payment_type = cli_review.select_from_list(
         payment_types,
@@ -455,11 +691,7 @@ def process_gmail_message(
     else:
         if cli_review.confirm_action("Add to spreadsheet?"):
             try:
-                writer = sheets_writer.SheetsWriter(
-                    credentials_path=config['google_cloud']['credentials_file'],
-                    spreadsheet_id=config['google_sheets']['spreadsheet_id'],
-                    sheet_name=config['google_sheets'].get('sheet_name', 'Income and Expenses')
-                )
+                writer = create_sheets_writer(config)
 
                 next_id = writer.get_next_id()
 
@@ -474,62 +706,62 @@ def process_gmail_message(
 
                 row_num = writer.append_row(row)
                 cli_review.display_success(
-                    f"Added row #{next_id} to \"{config['google_sheets'].get('sheet_name', 'Income and Expenses')}\""
+                    f"Added row #{next_id} to \"{config.sheet_name}\""
                 )
 
-                # Upload attachments to Google Drive if configured
-                archive_folder_id = config.get('google_drive', {}).get('archive_folder_id')
+                # Upload attachments to Google Drive if configured. The upload
+                # runs in the background while the user handles printing.
+                upload = None
+                archive_folder_id = config.archive_folder_id
                 if archive_folder_id and email_data.attachment_paths:
                     if cli_review.confirm_action("Upload attachments to Google Drive?"):
-                        try:
-                            uploader = drive_uploader.DriveUploader(
-                                credentials=fetcher.credentials,
-                                archive_folder_id=archive_folder_id
-                            )
-
-                            # Use email received date for folder organization
-                            if email_data.date:
-                                archive_month = email_data.date.strftime('%B')  # e.g., "January"
-                            else:
-                                archive_month = row.month  # Fallback to form date
-
-                            file_ids = uploader.upload_attachments(
-                                file_paths=email_data.attachment_paths,
-                                entry_id=next_id,
-                                requestor_name=reviewed_data.get('Requestor', ''),
-                                month=archive_month
-                            )
-
-                            cli_review.display_success(
-                                f"Uploaded {len(file_ids)} file(s) to Drive archive ({archive_month.upper()})"
-                            )
-                        except Exception as e:
-                            cli_review.display_error(f"Failed to upload to Drive: {e}")
-                            # Continue even if Drive upload fails
-
-                # Offer to print attachments (PDFs and images)
-                printable_files = email_data.pdf_paths + email_data.image_paths
-                if printable_files:
-                    if cli_review.confirm_action("Print attachments?", default=False):
-                        try:
-                            printers = printer.get_available_printers()
-                            default_printer = printer.get_default_printer()
-
-                            if printers:
-                                selected = printer.select_printer(printers, default_printer)
-                            else:
-                                selected = None
-                                print("Using system default printer")
-
-                            print(f"\nPrinting {len(printable_files)} file(s)...")
-                            success, failed = printer.print_pdfs(printable_files, selected)
-
-                            if success > 0:
-                                cli_review.display_success(f"Sent {success} file(s) to printer")
-                            if failed > 0:
-                                cli_review.display_error(f"Failed to print {failed} file(s)")
-                        except Exception as e:
-                            cli_review.display_error(f"Print error: {e}")
+                        # Use email received date for folder organization
+                        if email_data.date:
+                            archive_month = email_data.date.strftime('%B')  # e.g., "January"
+                        else:
+                            archive_month = row.month  # Fallback to form date
+
+                        upload_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='drive-archive')
+                        upload = upload_executor.submit(
+                            archive_attachments,
+                            credentials=fetcher.credentials,
+                            archive_folder_id=archive_folder_id,
+                            file_paths=email_data.attachment_paths,
+                            entry_id=next_id,
+                            requestor_name=reviewed_data.get('Requestor', ''),
+                            month=archive_month
+                        )
+                        upload_executor.shutdown(wait=False)
+
+                try:
+                    # Offer to print attachments (PDFs and images)
+                    printable_files = email_data.pdf_paths + email_data.image_paths
+                    if printable_files:
+                        if cli_review.confirm_action("Print attachments?", default=False):
+                            try:
+                                printers = printer.get_available_printers()
+                                default_printer = printer.get_default_printer()
+
+                                if printers:
+                                    selected = printer.select_printer(printers, default_printer)
+                                else:
+                                    selected = None
+                                    print("Using system default printer")
+
+                                print(f"\nPrinting {len(printable_files)} file(s)...")
+                                success, failed = printer.print_pdfs(printable_files, selected)
+
+                                if success > 0:
+                                    cli_review.display_success(f"Sent {success} file(s) to printer")
+                                if failed > 0:
+                                    cli_review.display_error(f"Failed to print {failed} file(s)")
+                            except Exception as e:
+                                cli_review.display_error(f"Print error: {e}")
+                finally:
+                    # Wait for the upload before the attachments are cleaned
+                    # up, even if printing failed or was interrupted
+                    if upload is not None:
+                        finish_drive_upload(upload, archive_month)
 
             except Exception as e:
                 cli_review.display_error(f"Failed to write to spreadsheet: {e}")
@@ -1,35 +1,107 @@
 """PDF processor module for converting PDFs to images."""
 
+import math
+import os
+import shutil
 import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 from pdf2image import convert_from_path
+from pdf2image.pdf2image import pdfinfo_from_path
 from PIL import Image
 
+# Optional in-process renderer; Poppler's pdftoppm is used without it
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+
+# Maximum PDFs rendered at once by convert_pdfs_to_images
+MAX_CONVERT_WORKERS = 4
+
+# pdftoppm processes splitting the pages of one PDF, leaving a core free
+RENDER_THREADS = max(1, (os.cpu_count() or 2) - 1)
+
+# Prefix of the per-conversion directories that hold rendered pages
+PAGE_DIR_PREFIX = 'pages_'
+
+# Page image formats; JPEG is written straight by the renderer and sent to
+# OCR as is, PNG keeps pages lossless
+PAGE_FORMATS = ('jpeg', 'png')
+
+# JPEG quality for page images, high enough to keep small print legible
+PAGE_JPEG_QUALITY = 92
+
+# zlib level for page PNGs saved by the PDFium renderer; they are deleted
+# after OCR, so encode speed matters more than size
+PNG_COMPRESS_LEVEL = 1
+
+# Page PNGs being saved at once while PDFium renders the next page
+MAX_SAVE_WORKERS = 4
+
+# PDFium may only be called from one thread at a time, even across documents
+_pdfium_lock = threading.Lock()
+
+# Auto DPI (opt-in): when even the smaller text lines on the first page are
+# at least LARGE_TEXT_LINE_PT tall (roughly 13pt type or handwriting), the
+# remaining pages render at AUTO_DPI_LARGE_TEXT, which OCR handles as well
+# as 300 DPI at less than half the pixels
+AUTO_DPI_LARGE_TEXT = 200
+LARGE_TEXT_LINE_PT = 12
+SMALL_LINE_PERCENTILE = 10  # Percentile of line heights taken as "smaller text"
+MIN_TEXT_LINE_PT = 3  # Thinner dark runs are rules or box borders
+INK_ROW_CONTRAST = 8  # Row mean this much below the background counts as ink
+
+# Pixel budget per rendered page, under the OCR step's 40M pixel limit so
+# oversized pages aren't rendered only to be scaled down again
+MAX_PAGE_PIXELS = 30_000_000
+
 
 def convert_pdf_to_images(
     pdf_path: str | Path,
     dpi: int = 300,
     output_dir: Optional[Path] = None,
-    poppler_path: Optional[str | Path] = None
+    poppler_path: Optional[str | Path] = None,
+    fmt: str = 'jpeg',
+    auto_dpi: bool = False,
+    thread_count: int = RENDER_THREADS
 ) -> list[Path]:
     """
     Convert a PDF file to a list of images (one per page).
 
+    Pages are rendered in-process with PDFium when pypdfium2 is installed,
+    otherwise with Poppler.
+
+    With auto_dpi, the first page is rendered at dpi as usual and measured;
+    the remaining pages render at AUTO_DPI_LARGE_TEXT (if lower than dpi)
+    when its smaller text lines are large enough to OCR reliably at that
+    resolution.
+
     Args:
         pdf_path: Path to the PDF file
         dpi: Resolution for the output images (default 300 for good OCR quality)
         output_dir: Directory to save images (uses temp dir if not specified)
         poppler_path: Path to Poppler bin directory (optional, uses PATH if not set)
+        fmt: Page image format, 'jpeg' (default) or 'png'
+        auto_dpi: Lower the resolution for PDFs with large text (default False)
+        thread_count: pdftoppm processes splitting the pages (default RENDER_THREADS)
 
     Returns:
         List of paths to the generated image files
 
     Raises:
         FileNotFoundError: If the PDF file doesn't exist
+        ValueError: If fmt is not a supported page format
         RuntimeError: If PDF conversion fails (e.g., Poppler not installed)
     """
+    if fmt not in PAGE_FORMATS:
+        raise ValueError(f"Unsupported page format: {fmt}")
+
     pdf_path = Path(pdf_path)
     if not pdf_path.exists():
         raise FileNotFoundError(f"PDF file not found: {pdf_path}")
@@ -39,13 +111,204 @@ def convert_pdf_to_images(
         output_dir = Path(tempfile.gettempdir()) / 'pta_parser' / 'images'
     output_dir.mkdir(parents=True, exist_ok=True)
 
+    # Each conversion writes into its own directory, so page filenames
+    # never collide with earlier runs or concurrent conversions
+    page_dir = Path(tempfile.mkdtemp(prefix=PAGE_DIR_PREFIX, dir=output_dir))
+
+    image_paths = None
+    if pdfium is not None:
+        try:
+            image_paths = _render_with_pdfium(pdf_path, dpi, page_dir, fmt, auto_dpi)
+        except Exception:
+            # Fall back to Poppler, which may cope with a PDF PDFium rejects
+            shutil.rmtree(page_dir, ignore_errors=True)
+            page_dir.mkdir()
+
+    if image_paths is None:
+        image_paths = _render_with_poppler(
+            pdf_path, dpi, page_dir, poppler_path, fmt, thread_count, auto_dpi
+        )
+
+    if not image_paths:
+        page_dir.rmdir()
+    return image_paths
+
+
+def _has_large_text(image: Image.Image, dpi: int) -> bool:
+    """
+    Check whether a rendered page's smaller text lines are large.
+
+    Each pixel row is averaged; runs of rows clearly darker than the page
+    background are taken as text lines. Runs thinner than MIN_TEXT_LINE_PT
+    (rules, box borders) are ignored, and the SMALL_LINE_PERCENTILE line
+    height is compared with LARGE_TEXT_LINE_PT, so a page counts as large
+    text only if nearly all of its lines are.
+
+    Args:
+        image: Rendered page
+        dpi: Resolution the page was rendered at
+
+    Returns:
+        True if the page's text can be rendered at AUTO_DPI_LARGE_TEXT
+    """
+    gray = image.convert('L')
+    row_means = list(gray.resize((1, gray.height), Image.Resampling.BOX).getdata())
+    if not row_means:
+        return False
+    background = max(row_means)
+    min_run = MIN_TEXT_LINE_PT * dpi / 72
+
+    heights = []
+    run = 0
+    for mean in row_means + [background]:
+        if mean < background - INK_ROW_CONTRAST:
+            run += 1
+        else:
+            if run >= min_run:
+                heights.append(run)
+            run = 0
+
+    if not heights:
+        return False
+    heights.sort()
+    small_line_pt = heights[len(heights) * SMALL_LINE_PERCENTILE // 100] * 72 / dpi
+    return small_line_pt >= LARGE_TEXT_LINE_PT
+
+
+def _render_with_pdfium(
+    pdf_path: Path,
+    dpi: int,
+    page_dir: Path,
+    fmt: str,
+    auto_dpi: bool
+) -> list[Path]:
+    """
+    Render each page of a PDF to an image file in-process with PDFium.
+
+    Pages are saved from a thread pool while the next page renders.
+
+    Args:
+        pdf_path: Path to the PDF file
+        dpi: Requested resolution, capped per page by MAX_PAGE_PIXELS
+        page_dir: Directory to save the page images in
+        fmt: Page image format ('jpeg' or 'png')
+        auto_dpi: Lower the DPI after the first page if its text is large
+
+    Returns:
+        List of paths to the page images
+    """
+    if fmt == 'jpeg':
+        extension, save_kwargs = 'jpg', {'format': 'JPEG', 'quality': PAGE_JPEG_QUALITY}
+    else:
+        extension, save_kwargs = 'png', {'format': 'PNG', 'compress_level': PNG_COMPRESS_LEVEL}
+
+    with _pdfium_lock:
+        pdf = pdfium.PdfDocument(pdf_path)
+        page_count = len(pdf)
+
+    image_paths = []
+    pending = deque()
     try:
-        # Convert PDF to images
-        convert_kwargs = {'dpi': dpi}
+        with ThreadPoolExecutor(max_workers=MAX_SAVE_WORKERS) as executor:
+            for i in range(page_count):
+                with _pdfium_lock:
+                    page = pdf[i]
+                    try:
+                        width_pt, height_pt = page.get_size()
+                        page_dpi = _page_dpi(width_pt, height_pt, dpi)
+                        bitmap = page.render(scale=page_dpi / 72)
+                        # Copy out of PDFium's buffer so saving needs no lock
+                        image = bitmap.to_pil().copy()
+                        bitmap.close()
+                    finally:
+                        page.close()
+
+                # The first page keeps its full-resolution render either way
+                if i == 0 and auto_dpi and dpi > AUTO_DPI_LARGE_TEXT:
+                    if _has_large_text(image, page_dpi):
+                        dpi = AUTO_DPI_LARGE_TEXT
+
+                image_path = page_dir / f"{pdf_path.stem}_page_{i + 1}.{extension}"
+                pending.append(executor.submit(image.save, image_path, **save_kwargs))
+                image_paths.append(image_path)
+
+                # Bound the rendered pages held in memory while saves catch up
+                if len(pending) > MAX_SAVE_WORKERS:
+                    pending.popleft().result()
+
+            for future in pending:
+                future.result()
+    finally:
+        with _pdfium_lock:
+            pdf.close()
+
+    return image_paths
+
+
+def _render_with_poppler(
+    pdf_path: Path,
+    dpi: int,
+    page_dir: Path,
+    poppler_path: Optional[str | Path],
+    fmt: str,
+    thread_count: int,
+    auto_dpi: bool
+) -> list[Path]:
+    """
+    Render each page of a PDF to an image file with Poppler's pdftoppm.
+
+    With auto_dpi, the first page is rendered on its own and measured
+    before the rest are rendered.
+
+    Args:
+        pdf_path: Path to the PDF file
+        dpi: Requested resolution, capped by MAX_PAGE_PIXELS
+        page_dir: Directory to save the page images in
+        poppler_path: Path to Poppler bin directory (optional, uses PATH if not set)
+        fmt: Page image format ('jpeg' or 'png')
+        thread_count: pdftoppm processes splitting the pages
+        auto_dpi: Lower the DPI after the first page if its text is large
+
+    Returns:
+        List of paths to the page images
+
+    Raises:
+        RuntimeError: If Poppler is not installed
+    """
+    try:
+        # pdftoppm writes the images itself; only their paths come back
+        convert_kwargs = {}
         if poppler_path:
             convert_kwargs['poppler_path'] = str(poppler_path)
-        images = convert_from_path(pdf_path, **convert_kwargs)
+        if fmt == 'jpeg':
+            convert_kwargs['jpegopt'] = {'quality': PAGE_JPEG_QUALITY}
+        dpi = _cap_dpi(pdf_path, dpi, convert_kwargs)
+        convert_kwargs.update(
+            output_folder=str(page_dir),
+            output_file=pdf_path.stem,
+            fmt=fmt,
+            paths_only=True
+        )
+
+        if not (auto_dpi and dpi > AUTO_DPI_LARGE_TEXT):
+            image_paths = convert_from_path(
+                pdf_path, dpi=dpi, thread_count=thread_count, **convert_kwargs
+            )
+        else:
+            first = convert_from_path(
+                pdf_path, dpi=dpi, first_page=1, last_page=1, **convert_kwargs
+            )
+            if first:
+                with Image.open(first[0]) as image:
+                    if _has_large_text(image, dpi):
+                        dpi = AUTO_DPI_LARGE_TEXT
+            # Paths come from listing the folder, so page 1 may be listed again
+            rest = convert_from_path(
+                pdf_path, dpi=dpi, first_page=2, thread_count=thread_count, **convert_kwargs
+            )
+            image_paths = first + [p for p in rest if p not in first]
     except Exception as e:
+        shutil.rmtree(page_dir, ignore_errors=True)
         if 'poppler' in str(e).lower() or 'pdftoppm' in str(e).lower():
             raise RuntimeError(
                 "Poppler is not installed or not in PATH. "
@@ -55,33 +318,122 @@ def convert_pdf_to_images(
             ) from e
         raise
 
-    # Save images and collect paths
-    image_paths = []
-    base_name = pdf_path.stem
+    return [Path(p) for p in image_paths]
 
-    for i, image in enumerate(images):
-        image_filename = f"{base_name}_page_{i + 1}.png"
-        image_path = output_dir / image_filename
 
-        # Handle existing files
-        counter = 1
-        while image_path.exists():
-            image_filename = f"{base_name}_page_{i + 1}_{counter}.png"
-            image_path = output_dir / image_filename
-            counter += 1
+def _cap_dpi(pdf_path: Path, dpi: int, poppler_kwargs: dict) -> int:
+    """
+    Lower the DPI if pages would render larger than MAX_PAGE_PIXELS.
 
-        image.save(image_path, 'PNG')
-        image_paths.append(image_path)
+    Uses the first page's size from pdfinfo. Letter and A4 pages at 300 DPI
+    are well under the limit, so only large-format pages are affected.
 
-    return image_paths
+    Args:
+        pdf_path: Path to the PDF file
+        dpi: Requested resolution
+        poppler_kwargs: Extra pdf2image arguments (poppler_path)
+
+    Returns:
+        DPI to render at
+    """
+    try:
+        info = pdfinfo_from_path(pdf_path, **poppler_kwargs)
+        # e.g. "612 x 792 pts (letter)"
+        width_pt, _, height_pt = info['Page size'].split()[:3]
+        width_pt, height_pt = float(width_pt), float(height_pt)
+    except Exception:
+        # Leave errors to the conversion itself
+        return dpi
 
+    return _page_dpi(width_pt, height_pt, dpi)
 
-def get_page_count(pdf_path: str | Path) -> int:
+
+def _page_dpi(width_pt: float, height_pt: float, dpi: int) -> int:
+    """Cap the DPI so a page of this size (in points) fits MAX_PAGE_PIXELS."""
+    area_sq_in = (width_pt / 72) * (height_pt / 72)
+    if area_sq_in <= 0:
+        return dpi
+    return max(1, min(dpi, int(math.sqrt(MAX_PAGE_PIXELS / area_sq_in))))
+
+
+def convert_pdfs_to_images(
+    pdf_paths: list[Path],
+    dpi: int = 300,
+    output_dir: Optional[Path] = None,
+    poppler_path: Optional[str | Path] = None,
+    fmt: str = 'jpeg',
+    auto_dpi: bool = False
+) -> list[list[Path]]:
+    """
+    Convert several PDF files to images concurrently.
+
+    Up to MAX_CONVERT_WORKERS PDFs are converted at once from a thread pool.
+    With Poppler, the RENDER_THREADS pdftoppm processes are shared out
+    between them, so the total stays within the CPU count. A single PDF
+    gets all of them. If any conversion fails, images from the others are
+    removed and the first failure (in input order) is raised.
+
+    Args:
+        pdf_paths: Paths to the PDF files
+        dpi: Resolution for the output images (default 300 for good OCR quality)
+        output_dir: Directory to save images (uses temp dir if not specified)
+        poppler_path: Path to Poppler bin directory (optional, uses PATH if not set)
+        fmt: Page image format, 'jpeg' (default) or 'png'
+        auto_dpi: Lower the resolution for PDFs with large text (default False)
+
+    Returns:
+        List of image path lists, one per PDF in input order
+
+    Raises:
+        FileNotFoundError: If a PDF file doesn't exist
+        ValueError: If fmt is not a supported page format
+        RuntimeError: If PDF conversion fails (e.g., Poppler not installed)
+    """
+    if len(pdf_paths) <= 1:
+        results = []
+        try:
+            for pdf_path in pdf_paths:
+                results.append(convert_pdf_to_images(pdf_path, dpi, output_dir, poppler_path, fmt, auto_dpi))
+        except Exception:
+            for image_paths in results:
+                cleanup_images(image_paths)
+            raise
+        return results
+
+    workers = min(len(pdf_paths), MAX_CONVERT_WORKERS)
+    thread_count = max(1, RENDER_THREADS // workers)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                convert_pdf_to_images, pdf_path, dpi, output_dir, poppler_path, fmt, auto_dpi,
+                thread_count
+            )
+            for pdf_path in pdf_paths
+        ]
+
+    results = []
+    error = None
+    for future in futures:
+        try:
+            results.append(future.result())
+        except Exception as e:
+            error = error or e
+
+    if error:
+        for image_paths in results:
+            cleanup_images(image_paths)
+        raise error
+
+    return results
+
+
+def get_page_count(pdf_path: str | Path, poppler_path: Optional[str | Path] = None) -> int:
     """
     Get the number of pages in a PDF file.
 
     Args:
         pdf_path: Path to the PDF file
+        poppler_path: Path to Poppler bin directory (optional, uses PATH if not set)
 
     Returns:
         Number of pages in the PDF
@@ -90,23 +442,41 @@ def get_page_count(pdf_path: str | Path) -> int:
     if not pdf_path.exists():
         raise FileNotFoundError(f"PDF file not found: {pdf_path}")
 
-    # Use pdf2image's page count functionality
-    from pdf2image.pdf2image import pdfinfo_from_path
+    # PDFium reads the page count in-process, without starting pdfinfo
+    if pdfium is not None:
+        try:
+            with _pdfium_lock:
+                pdf = pdfium.PdfDocument(pdf_path)
+                try:
+                    return len(pdf)
+                finally:
+                    pdf.close()
+        except Exception:
+            pass  # Let pdfinfo try
 
-    try:
-        info = pdfinfo_from_path(pdf_path)
-        return info.get('Pages', 0)
-    except Exception:
-        # Fallback: convert and count
-        images = convert_from_path(pdf_path, dpi=72)  # Low DPI for speed
-        return len(images)
+    poppler_kwargs = {}
+    if poppler_path:
+        poppler_kwargs['poppler_path'] = str(poppler_path)
+
+    # No rasterizing fallback: convert_from_path runs pdfinfo itself, so it
+    # would fail the same way
+    info = pdfinfo_from_path(pdf_path, **poppler_kwargs)
+    return info.get('Pages', 0)
 
 
 def cleanup_images(image_paths: list[Path]) -> None:
-    """Remove temporary image files."""
+    """Remove temporary image files and the page directories holding them."""
+    page_dirs = set()
     for path in image_paths:
         try:
-            if path.exists():
-                path.unlink()
+            path.unlink(missing_ok=True)
         except OSError:
             pass
+        if path.parent.name.startswith(PAGE_DIR_PREFIX):
+            page_dirs.add(path.parent)
+
+    for page_dir in page_dirs:
+        try:
+            page_dir.rmdir()
+        except OSError:
+            pass  # Not empty or already gone
@@ -3,26 +3,41 @@
 import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 
+# lpr print jobs submitted at once by print_pdfs
+MAX_PRINT_WORKERS = 8
+
+
 def get_available_printers() -> list[str]:
     """
     Get list of available printers on Windows.
 
+    The list is looked up once per process; call refresh_printers() to
+    pick up printers added since.
+
     Returns:
         List of printer names
     """
+    return list(_available_printers())
+
+
+@lru_cache(maxsize=1)
+def _available_printers() -> tuple[str, ...]:
+    """Look up the available printers (see get_available_printers)."""
     if sys.platform != 'win32':
-        return []
+        return ()
 
     try:
         import win32print
         printers = []
         for printer in win32print.EnumPrinters(win32print.PRINTER_ENUM_LOCAL | win32print.PRINTER_ENUM_CONNECTIONS):
             printers.append(printer[2])  # printer[2] is the printer name
-        return printers
+        return tuple(printers)
     except ImportError:
         # Fallback: try to get printers via PowerShell
         try:
@@ -33,16 +48,19 @@ def get_available_printers() -> list[str]:
                 timeout=10
             )
             if result.returncode == 0:
-                return [p.strip() for p in result.stdout.strip().split('\n') if p.strip()]
+                return tuple(p.strip() for p in result.stdout.strip().split('\n') if p.strip())
         except Exception:
             pass
-        return []
+        return ()
 
 
+@lru_cache(maxsize=1)
 def get_default_printer() -> Optional[str]:
     """
     Get the default printer name.
 
+    Looked up once per process, like get_available_printers().
+
     Returns:
         Default printer name or None
     """
@@ -69,6 +87,12 @@ def get_default_printer() -> Optional[str]:
         return None
 
 
+def refresh_printers() -> None:
+    """Forget cached printer lookups so the next calls query the system again."""
+    _available_printers.cache_clear()
+    get_default_printer.cache_clear()
+
+
 def print_pdf(file_path: Path, printer_name: Optional[str] = None) -> bool:
     """
     Print a PDF file.
@@ -136,45 +160,144 @@ def print_pdf(file_path: Path, printer_name: Optional[str] = None) -> bool:
             return False
 
 
+class PrintSession:
+    """
+    Spool files straight to a Windows printer through one open handle.
+
+    Files are sent as RAW jobs, which skips launching a PDF viewer per file
+    but only works on printers that interpret PDF themselves (many network
+    laser printers do). Requires pywin32.
+    """
+
+    def __init__(self, printer_name: Optional[str] = None):
+        """
+        Open the printer.
+
+        Args:
+            printer_name: Name of printer (uses default if None)
+        """
+        import win32print
+        self._win32print = win32print
+        self.printer_name = printer_name or win32print.GetDefaultPrinter()
+        self._handle = win32print.OpenPrinter(self.printer_name)
+
+    def __enter__(self) -> 'PrintSession':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the printer handle."""
+        if self._handle is not None:
+            self._win32print.ClosePrinter(self._handle)
+            self._handle = None
+
+    def print_file(self, file_path: Path) -> None:
+        """
+        Send a file to the printer as one RAW job.
+
+        Args:
+            file_path: Path to the file to print
+        """
+        data = file_path.read_bytes()
+        self._win32print.StartDocPrinter(self._handle, 1, (file_path.name, None, 'RAW'))
+        try:
+            self._win32print.StartPagePrinter(self._handle)
+            self._win32print.WritePrinter(self._handle, data)
+            self._win32print.EndPagePrinter(self._handle)
+        finally:
+            self._win32print.EndDocPrinter(self._handle)
+
+
 def print_pdfs(
     file_paths: list[Path],
     printer_name: Optional[str] = None,
-    confirm_each: bool = False
+    confirm_each: bool = False,
+    raw: bool = False
 ) -> tuple[int, int]:
     """
     Print multiple PDF files.
 
+    Any confirmations are asked up front. With lpr (non-Windows) the jobs
+    are then submitted concurrently, so they may reach the printer queue
+    out of order; on Windows they are submitted one at a time.
+
     Args:
         file_paths: List of PDF file paths
         printer_name: Printer name (uses default if None)
         confirm_each: If True, confirm before each file
+        raw: If True on Windows, spool the PDFs directly through a
+             PrintSession, for printers that accept PDF natively
 
     Returns:
         Tuple of (successful_count, failed_count)
     """
-    successful = 0
-    failed = 0
-
-    for file_path in file_paths:
-        if confirm_each:
+    if confirm_each:
+        to_print = []
+        for file_path in file_paths:
             response = input(f"Print {file_path.name}? (y/n): ").strip().lower()
-            if response != 'y':
-                continue
+            if response == 'y':
+                to_print.append(file_path)
+    else:
+        to_print = list(file_paths)
+
+    # lpr startup dominates each job, so lpr jobs are submitted concurrently;
+    # results are reported in input order. ShellExecute needs COM set up on
+    # the calling thread, and PDF handlers drop overlapping print requests,
+    # so Windows jobs stay serial.
+    if raw and sys.platform == 'win32' and to_print:
+        results = _spool_pdfs(to_print, printer_name)
+    elif len(to_print) <= 1 or sys.platform == 'win32':
+        results = [_try_print_pdf(file_path, printer_name) for file_path in to_print]
+    else:
+        workers = min(MAX_PRINT_WORKERS, len(to_print))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(lambda p: _try_print_pdf(p, printer_name), to_print))
 
-        try:
-            if print_pdf(file_path, printer_name):
-                successful += 1
-                print(f"  Sent to printer: {file_path.name}")
-            else:
-                failed += 1
-                print(f"  Failed to print: {file_path.name}")
-        except Exception as e:
+    successful = 0
+    failed = 0
+    for file_path, (ok, error) in zip(to_print, results):
+        if ok:
+            successful += 1
+            print(f"  Sent to printer: {file_path.name}")
+        elif error is None:
             failed += 1
-            print(f"  Error printing {file_path.name}: {e}")
+            print(f"  Failed to print: {file_path.name}")
+        else:
+            failed += 1
+            print(f"  Error printing {file_path.name}: {error}")
 
     return (successful, failed)
 
 
+def _try_print_pdf(file_path: Path, printer_name: Optional[str]) -> tuple[bool, Optional[Exception]]:
+    """Print a PDF, returning (success, error) instead of raising."""
+    try:
+        return print_pdf(file_path, printer_name), None
+    except Exception as e:
+        return False, e
+
+
+def _spool_pdfs(file_paths: list[Path], printer_name: Optional[str]) -> list[tuple[bool, Optional[Exception]]]:
+    """Spool PDFs through one PrintSession, falling back to print_pdf per file."""
+    try:
+        session = PrintSession(printer_name)
+    except Exception:
+        # pywin32 missing or the printer could not be opened
+        return [_try_print_pdf(file_path, printer_name) for file_path in file_paths]
+
+    results = []
+    with session:
+        for file_path in file_paths:
+            try:
+                session.print_file(file_path)
+                results.append((True, None))
+            except Exception:
+                results.append(_try_print_pdf(file_path, printer_name))
+    return results
+
+
 def select_printer(printers: list[str], default: Optional[str] = None) -> Optional[str]:
     """
     Let user select a printer from a list.
@@ -197,6 +320,9 @@ def select_printer(printers: list[str], default: Optional[str] = None) -> Option
 
     print(f"  {len(printers) + 1}. Use system default")
 
+    # Lowercased once for matching typed printer names
+    lowered_printers = [(printer, printer.lower()) for printer in printers]
+
     while True:
         try:
             choice = input("\nSelect printer: ").strip()
@@ -212,7 +338,8 @@ def select_printer(printers: list[str], default: Optional[str] = None) -> Option
                 print(f"Please enter 1-{len(printers) + 1}")
         except ValueError:
             # Maybe they typed the printer name
-            for printer in printers:
-                if choice.lower() in printer.lower():
+            lowered_choice = choice.lower()
+            for printer, lowered in lowered_printers:
+                if lowered_choice in lowered:
                     return printer
             print("Invalid selection")
@@ -1,6 +1,7 @@
 """Google Sheets writer module for appending reimbursement records."""
 
 import os
+import re
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -10,7 +11,24 @@ from google.oauth2 import service_account
 from googleapiclient.discovery import build
 
 
-@dataclass
+# Form dates, matched the way strptime matches %m, %d and %Y/%y; the
+# separator must be the same on both sides
+_FORM_DATE_RE = re.compile(
+    r'(?P<month>1[0-2]|0[1-9]|[1-9])(?P<sep>[-/])'
+    r'(?P<day>3[01]|[12]\d|0[1-9]|[1-9]| [1-9])(?P=sep)'
+    r'(?P<year>\d{4}|\d{2})'
+)
+
+# Row number of an A1-notation cell such as "A123"
+_CELL_ROW_RE = re.compile(r'[A-Z]+(\d+)')
+
+_MONTH_NAMES = (
+    'January', 'February', 'March', 'April', 'May', 'June',
+    'July', 'August', 'September', 'October', 'November', 'December'
+)
+
+
+@dataclass(slots=True)
 class SpreadsheetRow:
     """Data for a single spreadsheet row (columns A-T)."""
     id: int                          # A
@@ -57,6 +75,8 @@ class SheetsWriter:
         self.spreadsheet_id = spreadsheet_id
         self.sheet_name = sheet_name
         self.service = self._authenticate(credentials_path)
+        # Next ID, read from the sheet once and then advanced locally
+        self._next_id: Optional[int] = None
 
     def _authenticate(self, credentials_path: str | Path) -> any:
         """Authenticate with Google Sheets API."""
@@ -75,15 +95,22 @@ class SheetsWriter:
         """
         Get the next available ID from the spreadsheet.
 
+        The ID column is read on the first call only; rows appended through
+        this writer advance the cached value.
+
         Returns:
             Next ID number (max existing ID + 1)
         """
+        if self._next_id is not None:
+            return self._next_id
+
         try:
-            # Read the ID column (column A)
-            range_name = f"'{self.sheet_name}'!A:A"
+            # Read the ID column (column A) below the header, as raw numbers
+            range_name = f"'{self.sheet_name}'!A2:A"
             result = self.service.spreadsheets().values().get(
                 spreadsheetId=self.spreadsheet_id,
-                range=range_name
+                range=range_name,
+                valueRenderOption='UNFORMATTED_VALUE'
             ).execute()
 
             values = result.get('values', [])
@@ -98,7 +125,8 @@ class SheetsWriter:
                     except (ValueError, IndexError):
                         continue
 
-            return max_id + 1
+            self._next_id = max_id + 1
+            return self._next_id
 
         except Exception as e:
             # If we can't read, start from 1
@@ -115,50 +143,50 @@ class SheetsWriter:
         Returns:
             The row number where data was inserted
         """
-        # Prepare the row values in column order (A-T)
-        values = [[
-            row.id,              # A
-            row.income_expense,  # B
-            row.year,            # C
-            row.month,           # D
-            row.date_received,   # E
-            row.submitted_by,    # F
-            row.grade,           # G
-            row.type,            # H
-            row.budget_category, # I
-            row.budget_item,     # J
-            row.amount_submitted,# K
-            row.amount_paid,     # L
-            row.check_number,    # M
-            row.myptez,          # N
-            row.bank,            # O
-            row.reconcile,       # P
-            row.report,          # Q
-            row.all_mats_printed,# R
-            row.double_signed,   # S
-            row.notes,           # T
-        ]]
-
-        body = {'values': values}
+        return self.append_rows([row])[0]
+
+    def append_rows(self, rows: list[SpreadsheetRow]) -> list[int]:
+        """
+        Append several rows to the spreadsheet in a single request.
+
+        Args:
+            rows: SpreadsheetRows with data to append, in order
+
+        Returns:
+            The row number where each row was inserted (-1 if unknown)
+        """
+        if not rows:
+            return []
+
+        body = {'values': [_row_values(row) for row in rows]}
 
         # Append to the sheet
-        result = self.service.spreadsheets().values().append(
-            spreadsheetId=self.spreadsheet_id,
-            range=f"'{self.sheet_name}'!A:T",
-            valueInputOption='USER_ENTERED',
-            insertDataOption='INSERT_ROWS',
-            body=body
-        ).execute()
-
-        # Parse the updated range to get row number
+        try:
+            result = self.service.spreadsheets().values().append(
+                spreadsheetId=self.spreadsheet_id,
+                range=f"'{self.sheet_name}'!A:T",
+                valueInputOption='USER_ENTERED',
+                insertDataOption='INSERT_ROWS',
+                body=body
+            ).execute()
+        except Exception:
+            # The sheet may have changed; re-read IDs next time
+            self._next_id = None
+            raise
+
+        if self._next_id is not None:
+            self._next_id = max(self._next_id, max(row.id for row in rows) + 1)
+
+        # Parse the updated range to get the first row number
         updated_range = result.get('updates', {}).get('updatedRange', '')
-        # Extract row number from range like "'Sheet'!A123:N123"
-        if ':' in updated_range:
-            row_part = updated_range.split(':')[0]
-            row_num = ''.join(filter(str.isdigit, row_part.split('!')[-1]))
-            return int(row_num) if row_num else -1
+        # Extract row number from range like "'Sheet'!A123:T125"; the sheet
+        # name itself may contain ':' or digits, so look after the last '!'
+        match = _CELL_ROW_RE.match(updated_range.rpartition('!')[2])
+        if match:
+            start = int(match.group(1))
+            return [start + i for i in range(len(rows))]
 
-        return -1
+        return [-1] * len(rows)
 
     def get_column_headers(self) -> list[str]:
         """Get the column headers from the first row."""
@@ -177,6 +205,32 @@ class SheetsWriter:
             return []
 
 
+def _row_values(row: SpreadsheetRow) -> list:
+    """Get a row's cell values in column order (A-T)."""
+    return [
+        row.id,              # A
+        row.income_expense,  # B
+        row.year,            # C
+        row.month,           # D
+        row.date_received,   # E
+        row.submitted_by,    # F
+        row.grade,           # G
+        row.type,            # H
+        row.budget_category, # I
+        row.budget_item,     # J
+        row.amount_submitted,# K
+        row.amount_paid,     # L
+        row.check_number,    # M
+        row.myptez,          # N
+        row.bank,            # O
+        row.reconcile,       # P
+        row.report,          # Q
+        row.all_mats_printed,# R
+        row.double_signed,   # S
+        row.notes,           # T
+    ]
+
+
 def create_spreadsheet_row(
     form_data: dict[str, str],
     email_date: Optional[datetime],
@@ -205,15 +259,20 @@ def create_spreadsheet_row(
     month = ""
 
     if form_date:
-        # Try to parse various date formats
-        for fmt in ['%m-%d-%Y', '%m/%d/%Y', '%m-%d-%y', '%m/%d/%y']:
+        # MM-DD-YYYY, MM/DD/YYYY, MM-DD-YY or MM/DD/YY
+        match = _FORM_DATE_RE.fullmatch(form_date)
+        if match:
+            month_num, day, year_str = int(match['month']), int(match['day']), match['year']
+            parsed_year = int(year_str)
+            if len(year_str) == 2:
+                # Same pivot as strptime's %y
+                parsed_year += 1900 if parsed_year >= 69 else 2000
             try:
-                parsed = datetime.strptime(form_date, fmt)
-                year = parsed.year
-                month = parsed.strftime('%B')  # Full month name
-                break
+                datetime(parsed_year, month_num, day)  # Reject e.g. 02/30
+                year = parsed_year
+                month = _MONTH_NAMES[month_num - 1]
             except ValueError:
-                continue
+                pass
 
     # Format email received date
     date_received = ""